@@ -33,6 +33,8 @@ from config.database import (
 from utils.ai_resume_analyzer import AIResumeAnalyzer
 from utils.resume_builder import ResumeBuilder
 from utils.resume_analyzer import ResumeAnalyzer
+from utils.resume_document import ResumeDocument
+from utils.timing import TIMING_DEBUG, get_stage_stats, span
 import traceback
 import plotly.express as px
 import pandas as pd
@@ -808,6 +810,28 @@ class ResumeApp:
         st.session_state.analytics_data = analytics
         return analytics
 
+    def extract_pdf_progressively(self, uploaded_file, role_info):
+        """Extract PDF text page by page, showing provisional results after the first page"""
+        placeholder = st.empty()
+        pages = []
+        for page_text in self.analyzer.iter_text_from_pdf(uploaded_file):
+            pages.append(page_text)
+            # A cache hit or a one-page PDF is already the whole document; the full
+            # analysis follows, so a provisional pass would only repeat it
+            if len(pages) == 1 and page_text.strip() and not self.analyzer.last_extraction_complete:
+                # First-page-only results must not land in the analysis cache
+                provisional = self.analyzer.analyze_resume({'raw_text': page_text}, role_info, use_cache=False)
+                if 'error' not in provisional and provisional.get('document_type') == 'resume':
+                    with placeholder.container():
+                        st.info(f"Provisional ATS score from the first page: {provisional['ats_score']} "
+                                "(still reading the remaining pages...)")
+                        if provisional.get('name') or provisional.get('email'):
+                            st.markdown(f"**Contact:** {provisional.get('name', '')} {provisional.get('email', '')}")
+                        if provisional.get('summary'):
+                            st.markdown(f"**Summary:** {provisional['summary'][:300]}")
+        placeholder.empty()
+        return ''.join(pages)
+
     def handle_resume_upload(self):
         """Handle resume upload and analysis"""
         uploaded_file = st.file_uploader(
@@ -1562,7 +1586,7 @@ class ResumeApp:
                         try:
                             if uploaded_file.type == "application/pdf":
                                 try:
-                                    text = self.analyzer.extract_text_from_pdf(uploaded_file)
+                                    text = self.extract_pdf_progressively(uploaded_file, role_info)
                                 except Exception as pdf_error:
                                     st.error(f"PDF extraction failed: {str(pdf_error)}")
                                     st.info("Trying alternative PDF extraction method...")
@@ -1593,8 +1617,16 @@ class ResumeApp:
                             st.error(f"Error reading file: {str(e)}")
                             return
 
+                        # Let the user know when extraction stopped early on a resource budget
+                        budget = self.analyzer.last_budget_exceeded
+                        if budget:
+                            st.warning(f"⚠️ {budget['message']}. The analysis below only covers the text extracted so far.")
+
+                        # Normalize once; every analysis stage reuses its cached views
+                        document = ResumeDocument(text)
+
                         # Analyze the document
-                        analysis = self.analyzer.analyze_resume({'raw_text': text}, role_info)
+                        analysis = self.analyzer.analyze_resume({'raw_text': document}, role_info)
                         
                         # Check if analysis returned an error
                         if 'error' in analysis:
@@ -1626,7 +1658,8 @@ class ResumeApp:
 
                         # Save to database
                         try:
-                            resume_id = save_resume_data(resume_data)
+                            with span('db.save_resume'):
+                                resume_id = save_resume_data(resume_data)
 
                             # Save analysis data
                             analysis_data = {
@@ -1638,7 +1671,8 @@ class ResumeApp:
                                 'missing_skills': ','.join(analysis['keyword_match']['missing_skills']),
                                 'recommendations': ','.join(analysis['suggestions'])
                             }
-                            save_analysis_data(resume_id, analysis_data)
+                            with span('db.save_analysis'):
+                                save_analysis_data(resume_id, analysis_data)
                             st.success("Resume data saved successfully!")
                         except Exception as e:
                             st.error(f"Error saving to database: {str(e)}")
@@ -1725,6 +1759,20 @@ class ResumeApp:
 
                         st.markdown("</div>", unsafe_allow_html=True)
 
+                        # Fit across all roles, scored in one pass
+                        with st.expander("🧭 Which roles fit you best?"):
+                            try:
+                                for fit in self.analyzer.rank_roles(document, self.job_roles, top_n=5):
+                                    st.markdown(f"**{fit['role']}** ({fit['category']}): {int(fit['score'])}% skill match")
+                            except Exception as e:
+                                st.error(f"Could not rank roles: {str(e)}")
+
+                        # Where the time went, only with ANALYSIS_TIMING_DEBUG=1
+                        if analysis.get('timings'):
+                            with st.expander("⏱️ Stage timings (debug)"):
+                                st.json(analysis['timings'])
+                                st.dataframe(pd.DataFrame.from_dict(get_stage_stats(), orient='index'))
+
                     with col2:
                         # Format Score Card
                         st.markdown("""
@@ -2734,15 +2782,16 @@ class ResumeApp:
                                         "resume_score", 0)
 
                                     # Save to database
-                                    analysis_id = save_ai_analysis_data(
-                                        None,  # No user_id needed
-                                        {
-                                            "model_used": selected_model,
-                                            "resume_score": resume_score,
-                                            "job_role": job_role,
-                                            "analysis": analysis_result.get("analysis", "")
-                                        }
-                                    )
+                                    with span('db.save_ai_analysis'):
+                                        analysis_id = save_ai_analysis_data(
+                                            None,  # No user_id needed
+                                            {
+                                                "model_used": selected_model,
+                                                "resume_score": resume_score,
+                                                "job_role": job_role,
+                                                "analysis": analysis_result.get("analysis", "")
+                                            }
+                                        )
 
                                     # Extract and save course recommendations
                                     if analysis_id:
@@ -2762,6 +2811,10 @@ class ResumeApp:
 
                                 # Complete the progress
                                 progress_bar.progress(100)
+
+                                if TIMING_DEBUG:
+                                    with st.expander("⏱️ Stage timings (debug)"):
+                                        st.dataframe(pd.DataFrame.from_dict(get_stage_stats(), orient='index'))
                                 
                                 # Display the analysis result
                                 if analysis_result and "error" not in analysis_result:
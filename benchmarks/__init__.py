@@ -0,0 +1,30 @@
+"""
+Offline benchmarks for Smart Resume AI.
+
+benchmarks.corpus generates synthetic resumes (text, PDF, DOCX and image-only PDF)
+of controlled size and skills density; benchmarks.run times the extractors and
+analyzers over them and writes the results as JSON:
+
+    python -m benchmarks.run --pages 1 5 20 --output benchmark-results.json
+
+benchmarks.regression times the hot paths over the checked-in fixtures and fails
+when they got slower than a stored baseline:
+
+    python -m benchmarks.regression --save-baseline
+    python -m benchmarks.regression --compare --threshold 0.10
+
+benchmarks.parity checks that the regex analytics mode (ANALYTICS_MODE=regex)
+agrees with the spaCy pipeline on the fixtures and a synthetic corpus:
+
+    python -m benchmarks.parity
+
+benchmarks.sandbox_check verifies that an over-budget parse in the extraction
+sandbox ends with the 'memory' outcome:
+
+    python -m benchmarks.sandbox_check
+
+benchmarks.batch_check verifies that a resume which crashes its worker process only
+fails itself in a batch analysis:
+
+    python -m benchmarks.batch_check
+"""
@@ -0,0 +1,59 @@
+"""
+Check that one crashing resume does not take down a batch.
+
+Runs utils.batch_analysis.analyze_many over a batch where one item kills the worker
+process that unpickles it; every other resume must still be analyzed and only the
+crashing one may come back as an error analysis:
+
+    python -m benchmarks.batch_check
+    python -m benchmarks.batch_check --size 200 --workers 4 --chunksize 8 --crash-at 57
+"""
+
+import argparse
+import os
+import sys
+
+from .run import job_requirements
+
+
+class WorkerCrash:
+    """Resume stand-in that terminates the worker process when it is unpickled"""
+
+    def __reduce__(self):
+        return os._exit, (1,)
+
+
+def resume_text(index):
+    return (f"Candidate {index}\ncandidate{index}@example.com\n\nEXPERIENCE\n"
+            f"Software engineer working with Python, SQL and Docker.\n\nEDUCATION\nB.Sc. Computer Science\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check per-item failure isolation in batch analysis")
+    parser.add_argument('--size', type=int, default=20)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--chunksize', type=int, default=2)
+    parser.add_argument('--crash-at', type=int, default=5, help="index of the item that kills its worker")
+    args = parser.parse_args(argv)
+
+    from utils.batch_analysis import analyze_many
+
+    resumes = [WorkerCrash() if i == args.crash_at else resume_text(i) for i in range(args.size)]
+    results = list(analyze_many(resumes, job_requirements(), workers=args.workers, chunksize=args.chunksize))
+
+    failed = sorted(index for index, analysis in results if 'error' in analysis)
+    print(f"{len(results)} result(s), errors at {failed}")
+
+    failures = []
+    if [index for index, _ in results] != list(range(args.size)):
+        failures.append("expected one result per resume in input order")
+    if failed != [args.crash_at]:
+        failures.append(f"expected only item {args.crash_at} to fail")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,250 @@
+"""
+Synthetic resume corpus.
+
+Resumes are generated from a seed, so the same arguments always give the same
+corpus. Size is controlled in pages (LINES_PER_PAGE lines each) and skills density
+is the share of experience and project bullets that mention catalog skills.
+"""
+
+import argparse
+import json
+import os
+import random
+
+LINES_PER_PAGE = 48
+
+SKILLS = [
+    'Python', 'Java', 'JavaScript', 'TypeScript', 'C++', 'C#', 'Go', 'Rust', 'SQL',
+    'PostgreSQL', 'MySQL', 'MongoDB', 'Redis', 'Docker', 'Kubernetes', 'AWS', 'Azure',
+    'GCP', 'Terraform', 'Linux', 'Git', 'React', 'Angular', 'Vue', 'Node.js', 'Django',
+    'Flask', 'FastAPI', 'Spring Boot', 'TensorFlow', 'PyTorch', 'Pandas', 'NumPy',
+    'Scikit-learn', 'Machine Learning', 'Deep Learning', 'Data Analysis', 'Tableau',
+    'Power BI', 'Excel', 'Spark', 'Hadoop', 'Kafka', 'GraphQL', 'REST APIs', 'CI/CD',
+    'Jenkins', 'Agile', 'Scrum', 'Figma', 'HTML', 'CSS', 'Communication', 'Leadership',
+    'Problem Solving', 'Project Management',
+]
+
+_FIRST_NAMES = ['Aarav', 'Maya', 'Liam', 'Sofia', 'Noah', 'Priya', 'Ethan', 'Zara', 'Omar', 'Lena']
+_LAST_NAMES = ['Sharma', 'Garcia', 'Chen', 'Okafor', 'Novak', 'Patel', 'Silva', 'Kim', 'Haddad', 'Berg']
+_COMPANIES = ['Acme Corp', 'Globex', 'Initech', 'Umbrella Labs', 'Stark Industries', 'Wayne Tech',
+              'Hooli', 'Vandelay Imports', 'Soylent Systems', 'Tyrell Analytics']
+_TITLES = ['Software Engineer', 'Data Analyst', 'Backend Developer', 'Frontend Developer',
+           'Data Scientist', 'DevOps Engineer', 'Product Analyst', 'ML Engineer']
+_VERBS = ['Developed', 'Designed', 'Implemented', 'Led', 'Improved', 'Managed', 'Created',
+          'Automated', 'Migrated', 'Optimized']
+_OBJECTS = ['a reporting pipeline', 'the billing service', 'customer dashboards', 'an internal API',
+            'the onboarding flow', 'data quality checks', 'the search index', 'deployment tooling',
+            'a recommendation engine', 'monitoring and alerting']
+_OUTCOMES = ['cutting latency by {n}%', 'serving {n}k daily users', 'saving {n} hours a week',
+             'raising conversion by {n}%', 'reducing costs by {n}%', 'with {n}% test coverage']
+_SCHOOLS = ['State University', 'Institute of Technology', 'City College', 'National University']
+_DEGREES = ['Bachelor of Science in Computer Science', 'Master of Science in Data Science',
+            'B.Tech in Information Technology', 'MCA']
+
+
+def _bullet(rng, skills_density):
+    line = f"• {rng.choice(_VERBS)} {rng.choice(_OBJECTS)}, {rng.choice(_OUTCOMES).format(n=rng.randint(5, 90))}"
+    if rng.random() < skills_density:
+        line += " using " + ", ".join(rng.sample(SKILLS, rng.randint(1, 3)))
+    return line
+
+
+def resume_text(seed=0, pages=1, skills_density=0.3):
+    """Return the text of one synthetic resume of about `pages` pages"""
+    rng = random.Random(seed)
+    first, last = rng.choice(_FIRST_NAMES), rng.choice(_LAST_NAMES)
+    lines = [
+        f"{first} {last}",
+        f"{first.lower()}.{last.lower()}@example.com | +1 555-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}",
+        f"linkedin.com/in/{first.lower()}{last.lower()} | github.com/{first.lower()}{seed}",
+        "",
+        "PROFESSIONAL SUMMARY",
+        f"{rng.choice(_TITLES)} with {rng.randint(2, 15)} years of experience building reliable products "
+        f"for fast-growing teams, focused on {rng.choice(_OBJECTS)} and {rng.choice(_OBJECTS)}.",
+        "",
+        "SKILLS",
+        ", ".join(rng.sample(SKILLS, max(3, int(len(SKILLS) * skills_density * 0.5)))),
+        "",
+        "EDUCATION",
+        f"{rng.choice(_DEGREES)}, {rng.choice(_SCHOOLS)}, {rng.randint(2005, 2022)}",
+        f"CGPA: {rng.randint(70, 98) / 10:.1f}/10",
+        "",
+        "EXPERIENCE",
+    ]
+
+    target = max(1, pages) * LINES_PER_PAGE
+    year = 2024
+    while len(lines) < target - 6:
+        start = year - rng.randint(1, 4)
+        lines.append(f"{rng.choice(_TITLES)}, {rng.choice(_COMPANIES)} ({start} - {year})")
+        for _ in range(rng.randint(3, 6)):
+            lines.append(_bullet(rng, skills_density))
+        lines.append("")
+        year = start
+
+    lines.append("PROJECTS")
+    for _ in range(2):
+        lines.append(f"{rng.choice(_OBJECTS).capitalize()}")
+        lines.append(_bullet(rng, skills_density))
+    lines.append("")
+    return "\n".join(lines)
+
+
+def ai_report(seed=0, items=8):
+    """Return a markdown analysis in the format the AI analyzer asks its models for"""
+    rng = random.Random(seed)
+    bullets = lambda: "\n".join(f"- {_bullet(rng, 0.5)[2:]}" for _ in range(items))
+    courses = "\n".join(
+        f"- **{skill} Fundamentals** by Coursera\n  Why: strengthens {skill} for the target role\n"
+        f"  Link: https://www.coursera.org/search?query={skill.replace(' ', '+')}"
+        for skill in rng.sample(SKILLS, items)
+    )
+    videos = "\n".join(
+        f"- **{skill} in 100 Minutes** by Tech Channel\n  https://www.youtube.com/watch?v=abc{i}"
+        for i, skill in enumerate(rng.sample(SKILLS, items))
+    )
+    return f"""## Overall Assessment
+{rng.choice(_TITLES)} resume with clear structure and measurable outcomes.
+
+## Skills Analysis
+- **Current Skills**:
+{chr(10).join('- ' + skill for skill in rng.sample(SKILLS, items))}
+- **Missing Skills**:
+{chr(10).join('- ' + skill for skill in rng.sample(SKILLS, items))}
+
+## Key Strengths
+{bullets()}
+
+## Areas for Improvement
+{bullets()}
+
+## ATS Optimization Assessment
+ATS Score: {rng.randint(40, 95)}/100
+
+## Recommended Courses
+{courses}
+
+## Recommended Videos
+{videos}
+
+## Resume Score
+Resume Score: {rng.randint(40, 95)}/100
+"""
+
+
+def write_pdf(text, path):
+    """Write text as a PDF with a real text layer (reportlab)"""
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+
+    pdf = canvas.Canvas(path, pagesize=letter)
+    width, height = letter
+    lines = text.split("\n")
+    for start in range(0, len(lines), LINES_PER_PAGE):
+        y = height - 48
+        for line in lines[start:start + LINES_PER_PAGE]:
+            pdf.setFont("Helvetica-Bold" if line.isupper() else "Helvetica", 9)
+            pdf.drawString(48, y, line)
+            y -= 14
+        pdf.showPage()
+    pdf.save()
+
+
+def write_docx(text, path):
+    """Write text as a DOCX, with headings and the skills line laid out as a table"""
+    from docx import Document
+
+    document = Document()
+    lines = text.split("\n")
+    previous = ""
+    for line in lines:
+        if line.isupper():
+            document.add_heading(line.title(), level=2)
+        elif previous == "SKILLS" and line:
+            skills = [skill.strip() for skill in line.split(",")]
+            columns = 4
+            table = document.add_table(rows=0, cols=columns)
+            for start in range(0, len(skills), columns):
+                cells = table.add_row().cells
+                for cell, skill in zip(cells, skills[start:start + columns]):
+                    cell.text = skill
+        elif line:
+            document.add_paragraph(line)
+        previous = line
+    document.save(path)
+
+
+def write_image_pdf(text, path, dpi=100):
+    """Write text as an image-only PDF (no text layer), like a scanned resume"""
+    from PIL import Image, ImageDraw, ImageFont
+
+    font = ImageFont.load_default()
+    size = (int(8.5 * dpi), int(11 * dpi))
+    line_height = max(12, (size[1] - dpi) // LINES_PER_PAGE)
+    lines = text.split("\n")
+    images = []
+    for start in range(0, len(lines), LINES_PER_PAGE):
+        image = Image.new("L", size, 255)
+        draw = ImageDraw.Draw(image)
+        y = dpi // 2
+        for line in lines[start:start + LINES_PER_PAGE]:
+            draw.text((dpi // 2, y), line, fill=0, font=font)
+            y += line_height
+        images.append(image)
+    images[0].save(path, "PDF", resolution=dpi, save_all=True, append_images=images[1:])
+
+
+WRITERS = {
+    'pdf': ('.pdf', write_pdf),
+    'docx': ('.docx', write_docx),
+    'image_pdf': ('.scan.pdf', write_image_pdf),
+}
+
+
+def generate_corpus(directory, pages=(1, 5, 20), densities=(0.1, 0.5),
+                    formats=('pdf', 'docx', 'image_pdf'), seed=0):
+    """
+    Write one resume per (pages, density) in every format to directory.
+
+    Returns a list of entries with 'name', 'pages', 'skills_density', 'text' and a
+    'files' dict mapping each format to its path. A format whose library is not
+    installed is left out of 'files' and reported under 'skipped'.
+    """
+    os.makedirs(directory, exist_ok=True)
+    corpus = []
+    for page_count in pages:
+        for density in densities:
+            name = f"resume-{page_count}p-d{int(density * 100):02d}"
+            text = resume_text(seed=seed + page_count * 1000 + int(density * 100),
+                               pages=page_count, skills_density=density)
+            entry = {'name': name, 'pages': page_count, 'skills_density': density,
+                     'text': text, 'files': {}, 'skipped': {}}
+            with open(os.path.join(directory, name + '.txt'), 'w', encoding='utf-8') as f:
+                f.write(text)
+            for fmt in formats:
+                suffix, writer = WRITERS[fmt]
+                path = os.path.join(directory, name + suffix)
+                try:
+                    writer(text, path)
+                    entry['files'][fmt] = path
+                except ImportError as e:
+                    entry['skipped'][fmt] = str(e)
+            corpus.append(entry)
+    return corpus
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic resume corpus")
+    parser.add_argument('directory')
+    parser.add_argument('--pages', type=int, nargs='+', default=[1, 5, 20])
+    parser.add_argument('--densities', type=float, nargs='+', default=[0.1, 0.5])
+    parser.add_argument('--formats', nargs='+', default=list(WRITERS), choices=list(WRITERS))
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    corpus = generate_corpus(args.directory, args.pages, args.densities, args.formats, args.seed)
+    print(json.dumps([{k: v for k, v in entry.items() if k != 'text'} for entry in corpus], indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+Parity check between the spaCy and regex analytics modes.
+
+Runs resume_analytics.ResumeAnalyzer in both modes over the resume fixtures and a
+synthetic corpus, and fails when their metrics drift apart by more than the
+tolerances, reporting the speedup of the regex path along the way:
+
+    python -m benchmarks.parity
+    python -m benchmarks.parity --score-tolerance 3 --synthetic 50
+"""
+
+import argparse
+import sys
+import time
+
+from . import corpus as corpus_module
+from .regression import load_fixtures
+
+
+def parity_corpus(synthetic=20, seed=0):
+    """Return [(name, text)]: the resume fixtures plus synthetic resumes of varied size and density"""
+    texts = list(load_fixtures()['resumes'].items())
+    for i in range(synthetic):
+        pages, density = 1 + i % 4, (0.1, 0.3, 0.6)[i % 3]
+        texts.append((f'synthetic-{i}', corpus_module.resume_text(seed + i, pages, density)))
+    return texts
+
+
+def differences(spacy_metrics, regex_metrics, score_tolerance=5, skills_tolerance=1,
+                sentence_tolerance=0.15):
+    """Return a description of every metric outside its tolerance (empty when they agree)"""
+    problems = []
+    score_delta = abs(spacy_metrics['profile_score'] - regex_metrics['profile_score'])
+    if score_delta > score_tolerance:
+        problems.append(f"profile_score {spacy_metrics['profile_score']} vs {regex_metrics['profile_score']}")
+    if abs(spacy_metrics['skills_count'] - regex_metrics['skills_count']) > skills_tolerance:
+        problems.append(f"skills_count {spacy_metrics['skills_count']} vs {regex_metrics['skills_count']}")
+    if spacy_metrics['experience_years'] != regex_metrics['experience_years']:
+        problems.append(f"experience_years {spacy_metrics['experience_years']} vs {regex_metrics['experience_years']}")
+    sentences = spacy_metrics['sentence_count']
+    if abs(sentences - regex_metrics['sentence_count']) > max(1, sentences * sentence_tolerance):
+        problems.append(f"sentence_count {sentences} vs {regex_metrics['sentence_count']}")
+    return problems
+
+
+def check(texts, score_tolerance=5, skills_tolerance=1, sentence_tolerance=0.15):
+    """Analyze texts in both modes; return (failures, spacy_seconds, regex_seconds)"""
+    from resume_analytics.analyzer import ResumeAnalyzer
+
+    spacy_analyzer, regex_analyzer = ResumeAnalyzer(mode='spacy'), ResumeAnalyzer(mode='regex')
+    spacy_analyzer.nlp  # load the model before timing
+
+    failures, spacy_seconds, regex_seconds = [], 0.0, 0.0
+    for name, text in texts:
+        start = time.perf_counter()
+        spacy_metrics = spacy_analyzer.analyze_resume(text)['metrics']
+        spacy_seconds += time.perf_counter() - start
+
+        start = time.perf_counter()
+        regex_metrics = regex_analyzer.analyze_resume(text)['metrics']
+        regex_seconds += time.perf_counter() - start
+
+        problems = differences(spacy_metrics, regex_metrics, score_tolerance,
+                               skills_tolerance, sentence_tolerance)
+        if problems:
+            failures.append((name, problems))
+    return failures, spacy_seconds, regex_seconds
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check the regex analytics mode against spaCy")
+    parser.add_argument('--synthetic', type=int, default=20, help="synthetic resumes besides the fixtures")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--score-tolerance', type=float, default=5, help="profile score points")
+    parser.add_argument('--skills-tolerance', type=int, default=1, help="skills count")
+    parser.add_argument('--sentence-tolerance', type=float, default=0.15, help="relative sentence count")
+    args = parser.parse_args(argv)
+
+    texts = parity_corpus(args.synthetic, args.seed)
+    failures, spacy_seconds, regex_seconds = check(
+        texts, args.score_tolerance, args.skills_tolerance, args.sentence_tolerance
+    )
+    for name, problems in failures:
+        print(f"{name}: {'; '.join(problems)}")
+    speedup = spacy_seconds / regex_seconds if regex_seconds else float('inf')
+    print(f"{len(texts) - len(failures)}/{len(texts)} resumes within tolerance; "
+          f"spaCy {spacy_seconds * 1000:.1f}ms, regex {regex_seconds * 1000:.1f}ms ({speedup:.1f}x faster)")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,301 @@
+"""
+Performance regression gate.
+
+Times the hot paths (standard analysis, PDF/DOCX extraction, the AI report parsers
+and the database save) over the checked-in fixtures in benchmarks/fixtures, stores
+the samples as a baseline and compares later runs against it:
+
+    python -m benchmarks.regression --save-baseline
+    python -m benchmarks.regression --compare --threshold 0.10
+
+A benchmark regresses when its median is more than the threshold slower than the
+baseline's and a Mann-Whitney U test on the two sample sets says the difference is
+significant (p < --alpha). The exit status is 1 if anything regressed. Baselines are
+only comparable on the machine and environment that recorded them.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import ExitStack
+from datetime import datetime
+
+from . import corpus as corpus_module
+from .run import _git_revision, database_saver, job_requirements, measure, scratch_database
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+BASELINE_PATH = os.getenv(
+    "BENCHMARK_BASELINE", os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+)
+# Shortest time one sample should take; faster functions are looped within a sample
+MIN_SAMPLE_SECONDS = 0.005
+
+AI_PARSERS = (
+    'extract_skills_from_analysis', 'extract_missing_skills_from_analysis',
+    'extract_course_recommendations', 'extract_video_recommendations',
+    '_extract_score_from_text', '_extract_ats_score_from_text',
+)
+
+
+def load_fixtures(directory=FIXTURES_DIR):
+    """Return {'resumes': {name: text}, 'reports': {name: markdown}} from the fixture directory"""
+    fixtures = {}
+    for kind, suffix in (('resumes', '.txt'), ('reports', '.md')):
+        folder = os.path.join(directory, kind)
+        fixtures[kind] = {}
+        for filename in sorted(os.listdir(folder)):
+            if filename.endswith(suffix):
+                with open(os.path.join(folder, filename), encoding='utf-8') as f:
+                    fixtures[kind][filename[:-len(suffix)]] = f.read()
+    return fixtures
+
+
+def _read(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def _analyzer_cases(fixtures):
+    from utils.resume_analyzer import ResumeAnalyzer
+    from utils.resume_document import ResumeDocument
+
+    analyzer = ResumeAnalyzer()
+    requirements = job_requirements()
+    return [
+        (f'ResumeAnalyzer.analyze_resume[{name}]',
+         lambda text=text: analyzer.analyze_resume({'raw_text': ResumeDocument(text)}, requirements))
+        for name, text in fixtures['resumes'].items()
+    ]
+
+
+def _extractor_cases(fixtures, scratch):
+    """PDF and DOCX files are rendered from the resume fixtures into scratch"""
+    from utils.docx_extraction import extract_docx_text
+    from utils.pdf_extraction import extract_pdf_text
+
+    cases = []
+    for name, text in fixtures['resumes'].items():
+        pdf_path = os.path.join(scratch, name + '.pdf')
+        corpus_module.write_pdf(text, pdf_path)
+        pdf = _read(pdf_path)
+        cases.append((f'pdf_extraction.pypdf[{name}]', lambda pdf=pdf: extract_pdf_text(pdf, 'pypdf')))
+        cases.append((f'pdf_extraction.pdfplumber[{name}]', lambda pdf=pdf: extract_pdf_text(pdf, 'pdfplumber')))
+
+        docx_path = os.path.join(scratch, name + '.docx')
+        corpus_module.write_docx(text, docx_path)
+        docx = _read(docx_path)
+        cases.append((f'docx_extraction[{name}]', lambda docx=docx: extract_docx_text(docx)))
+    return cases
+
+
+def _ai_parser_cases(fixtures):
+    from utils.ai_resume_analyzer import AIResumeAnalyzer
+
+    ai = AIResumeAnalyzer()
+    return [
+        (f'AIResumeAnalyzer.{method}[{name}]', lambda report=report, func=getattr(ai, method): func(report))
+        for name, report in fixtures['reports'].items()
+        for method in AI_PARSERS
+    ]
+
+
+def _database_cases(fixtures, stack):
+    from utils.resume_analyzer import ResumeAnalyzer
+
+    text = next(iter(fixtures['resumes'].values()))
+    analysis = ResumeAnalyzer().analyze_resume({'raw_text': text}, job_requirements())
+    stack.enter_context(scratch_database())
+    return [('database.save_resume_and_analysis', database_saver(analysis))]
+
+
+def _loops_for(func):
+    """How many calls make one sample last at least MIN_SAMPLE_SECONDS"""
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        if time.perf_counter() - start >= MIN_SAMPLE_SECONDS or loops >= 1 << 16:
+            return loops
+        loops *= 4
+
+
+def collect(fixtures, repeat=20, warmup=2, only=None):
+    """
+    Time every hot path over the fixtures.
+
+    Returns ({name: {'loops', 'samples_ms', 'median_ms'}}, {group: reason}), where each
+    sample is the mean time of one call in milliseconds and the second dict lists the
+    groups skipped because a dependency is missing.
+    """
+    benchmarks, skipped = {}, {}
+    with tempfile.TemporaryDirectory() as scratch, ExitStack() as stack:
+        groups = (
+            ('analyzers', lambda: _analyzer_cases(fixtures)),
+            ('extractors', lambda: _extractor_cases(fixtures, scratch)),
+            ('ai_parsers', lambda: _ai_parser_cases(fixtures)),
+            ('database', lambda: _database_cases(fixtures, stack)),
+        )
+        for group, build in groups:
+            try:
+                cases = build()
+            except ImportError as e:
+                skipped[group] = f"missing dependency: {e}"
+                continue
+            for name, func in cases:
+                if only and not any(pattern in name for pattern in only):
+                    continue
+                print(f"Timing {name}...", file=sys.stderr)
+                try:
+                    loops = _loops_for(func)
+                    samples = measure(lambda: [func() for _ in range(loops)], repeat, warmup)
+                except Exception as e:
+                    skipped[name] = f"{type(e).__name__}: {e}"
+                    continue
+                samples_ms = [sample / loops * 1000 for sample in samples]
+                benchmarks[name] = {
+                    'loops': loops,
+                    'samples_ms': samples_ms,
+                    'median_ms': statistics.median(samples_ms),
+                }
+    return benchmarks, skipped
+
+
+def _environment():
+    return {
+        'timestamp': datetime.now().isoformat(),
+        'git_revision': _git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def _p_value(baseline, current):
+    """Two-sided Mann-Whitney U p-value, or None without scipy"""
+    try:
+        from scipy.stats import mannwhitneyu
+    except ImportError:
+        return None
+    if baseline == current:
+        return 1.0
+    return float(mannwhitneyu(current, baseline, alternative='two-sided').pvalue)
+
+
+def compare(baseline, current, threshold=0.10, alpha=0.05):
+    """
+    Compare two {name: benchmark} dicts.
+
+    Returns one row per benchmark with the median delta (current / baseline - 1), the
+    p-value and a status: 'regression' or 'improvement' when the delta is beyond the
+    threshold and significant, 'ok' otherwise, or 'new' / 'missing' when a benchmark
+    is only in one of the runs. Without scipy the delta alone decides.
+    """
+    rows = []
+    for name in sorted(set(baseline) | set(current)):
+        if name not in baseline or name not in current:
+            rows.append({'benchmark': name, 'status': 'new' if name in current else 'missing'})
+            continue
+        before, after = baseline[name]['samples_ms'], current[name]['samples_ms']
+        before_median, after_median = statistics.median(before), statistics.median(after)
+        delta = (after_median / before_median - 1) if before_median else 0.0
+        p_value = _p_value(before, after)
+        significant = p_value is None or p_value < alpha
+        if delta > threshold and significant:
+            status = 'regression'
+        elif delta < -threshold and significant:
+            status = 'improvement'
+        else:
+            status = 'ok'
+        rows.append({
+            'benchmark': name,
+            'baseline_ms': before_median,
+            'current_ms': after_median,
+            'delta': delta,
+            'p_value': p_value,
+            'status': status,
+        })
+    return rows
+
+
+def format_rows(rows):
+    width = max([len(row['benchmark']) for row in rows] + [9])
+    lines = [f"{'benchmark':<{width}}  {'baseline':>10}  {'current':>10}  {'delta':>8}  {'p':>7}  status"]
+    for row in rows:
+        if 'delta' not in row:
+            lines.append(f"{row['benchmark']:<{width}}  {'':>10}  {'':>10}  {'':>8}  {'':>7}  {row['status']}")
+            continue
+        p_value = '-' if row['p_value'] is None else f"{row['p_value']:.4f}"
+        lines.append(
+            f"{row['benchmark']:<{width}}  {row['baseline_ms']:>8.3f}ms  {row['current_ms']:>8.3f}ms  "
+            f"{row['delta']:>+7.1%}  {p_value:>7}  {row['status']}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare hot-path timings against a stored baseline")
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument('--save-baseline', action='store_true', help="record a new baseline")
+    mode.add_argument('--compare', action='store_true', help="compare against the baseline")
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--fixtures', default=FIXTURES_DIR)
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="fail when a median is this much slower (0.10 = 10%%)")
+    parser.add_argument('--alpha', type=float, default=0.05, help="significance level of the test")
+    parser.add_argument('--repeat', type=int, default=20, help="samples per benchmark")
+    parser.add_argument('--warmup', type=int, default=2)
+    parser.add_argument('--only', nargs='+', default=None, help="only benchmarks whose name contains one of these")
+    parser.add_argument('--output', default=None, help="also write the comparison as JSON here")
+    args = parser.parse_args(argv)
+
+    if args.compare and not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; record one with --save-baseline", file=sys.stderr)
+        return 2
+
+    benchmarks, skipped = collect(load_fixtures(args.fixtures), args.repeat, args.warmup, args.only)
+    for name, reason in skipped.items():
+        print(f"Skipped {name}: {reason}", file=sys.stderr)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({'meta': _environment(), 'benchmarks': benchmarks}, f, indent=2)
+        print(f"Saved {len(benchmarks)} benchmarks to {args.baseline}")
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    meta = _environment()
+    for key in ('python', 'platform', 'cpu_count'):
+        if baseline['meta'].get(key) != meta[key]:
+            print(f"Warning: baseline {key} {baseline['meta'].get(key)!r} differs from {meta[key]!r}",
+                  file=sys.stderr)
+
+    recorded = baseline['benchmarks']
+    if args.only:
+        recorded = {name: result for name, result in recorded.items()
+                    if any(pattern in name for pattern in args.only)}
+    rows = compare(recorded, benchmarks, args.threshold, args.alpha)
+    if any('delta' in row and row['p_value'] is None for row in rows):
+        print("scipy is not installed; comparing medians without a significance test", file=sys.stderr)
+    print(format_rows(rows))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'meta': meta, 'baseline_meta': baseline['meta'], 'threshold': args.threshold,
+                       'alpha': args.alpha, 'skipped': skipped, 'rows': rows}, f, indent=2)
+
+    regressions = [row['benchmark'] for row in rows if row['status'] == 'regression']
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
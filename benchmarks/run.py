@@ -0,0 +1,426 @@
+"""
+Benchmark runner.
+
+Generates a synthetic corpus, times every suite over it and prints (or writes) one
+JSON document with the environment and a result per benchmark:
+
+    python -m benchmarks.run --pages 1 5 20 --repeat 5 --output results.json
+    python -m benchmarks.run --suites analyzers ai_parsers
+
+Extraction, analysis and spaCy Doc caches are disabled so every run measures real work. A suite
+whose dependencies are missing (e.g. no spaCy model, no Tesseract) is reported as
+skipped instead of failing the run.
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from contextlib import contextmanager
+from datetime import datetime
+
+# Measure the work itself, not cache lookups
+os.environ.setdefault("EXTRACTION_CACHE_ENABLED", "0")
+os.environ.setdefault("ANALYSIS_CACHE_ENABLED", "0")
+os.environ.setdefault("DOC_CACHE_ENABLED", "0")
+
+from . import corpus as corpus_module  # noqa: E402
+
+
+def _percentile(ordered, q):
+    index = max(0, min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def measure(func, repeat=3, warmup=1):
+    """Call func warmup + repeat times and return the timed durations in seconds"""
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def summarize(name, samples, items=1, **params):
+    """Build one JSON result from timed samples; params['pages'] adds pages per second"""
+    ordered = sorted(samples)
+    mean = statistics.fmean(ordered)
+    result = {
+        'benchmark': name,
+        'params': params,
+        'runs': len(ordered),
+        'latency_ms': {
+            'mean': mean * 1000,
+            'min': ordered[0] * 1000,
+            'p50': _percentile(ordered, 50) * 1000,
+            'p95': _percentile(ordered, 95) * 1000,
+            'max': ordered[-1] * 1000,
+            'stdev': (statistics.stdev(ordered) * 1000) if len(ordered) > 1 else 0.0,
+        },
+        'throughput': {'items_per_s': items / mean if mean else None},
+        'samples_ms': [sample * 1000 for sample in samples],
+    }
+    if params.get('pages'):
+        result['throughput']['pages_per_s'] = params['pages'] * items / mean if mean else None
+    return result
+
+
+def _read(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def _upload(path, mime_type):
+    """Stand-in for a Streamlit UploadedFile"""
+    upload = io.BytesIO(_read(path))
+    upload.name = os.path.basename(path)
+    upload.type = mime_type
+    return upload
+
+
+PDF = "application/pdf"
+DOCX = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+
+def job_requirements():
+    from config.job_roles import JOB_ROLES
+    category = next(iter(JOB_ROLES.values()))
+    return next(iter(category.values()))
+
+
+# Suites ----------------------------------------------------------------------
+
+def suite_extractors(entries, repeat, warmup, **_):
+    from utils.ai_resume_analyzer import AIResumeAnalyzer
+    from utils.docx_extraction import extract_docx_text
+    from utils.pdf_extraction import extract_pdf_text
+    from utils.pdf_triage import triage_pdf
+    from utils.resume_analyzer import ResumeAnalyzer
+    from utils.resume_parser import ResumeParser
+
+    standard, ai, parser = ResumeAnalyzer(), AIResumeAnalyzer(), ResumeParser()
+    pdf_cases = [
+        ('pdf_extraction.pypdf', lambda path: extract_pdf_text(_read(path), 'pypdf')),
+        ('pdf_extraction.pdfplumber', lambda path: extract_pdf_text(_read(path), 'pdfplumber')),
+        ('pdf_triage', lambda path: triage_pdf(_read(path))),
+        ('ResumeAnalyzer.extract_text_from_pdf', lambda path: standard.extract_text_from_pdf(_upload(path, PDF))),
+        ('ResumeParser.extract_text_from_pdf', lambda path: parser.extract_text_from_pdf(_upload(path, PDF))),
+        ('AIResumeAnalyzer.extract_text_from_pdf', lambda path: ai.extract_text_from_pdf(_upload(path, PDF))),
+    ]
+    docx_cases = [
+        ('docx_extraction', lambda path: extract_docx_text(_read(path))),
+        ('ResumeAnalyzer.extract_text_from_docx', lambda path: standard.extract_text_from_docx(_upload(path, DOCX))),
+        ('ResumeParser.extract_text_from_docx', lambda path: parser.extract_text_from_docx(_upload(path, DOCX))),
+        ('AIResumeAnalyzer.extract_text_from_docx', lambda path: ai.extract_text_from_docx(_upload(path, DOCX))),
+    ]
+
+    # Without these, OCR fails fast and would be timed as a few milliseconds of "work"
+    missing_ocr_tools = [tool for tool in ('tesseract', 'pdftoppm') if not shutil.which(tool)]
+
+    results = []
+    for entry in entries:
+        params = {'pages': entry['pages'], 'skills_density': entry['skills_density']}
+        for fmt, cases in (('pdf', pdf_cases), ('docx', docx_cases), ('image_pdf', pdf_cases)):
+            path = entry['files'].get(fmt)
+            if not path:
+                continue
+            for name, func in cases:
+                # Scans only go through the extractors that can OCR them
+                if fmt == 'image_pdf' and name not in ('pdf_triage', 'AIResumeAnalyzer.extract_text_from_pdf'):
+                    continue
+                if fmt == 'image_pdf' and name != 'pdf_triage':
+                    skipped = _ocr_skip_reason(missing_ocr_tools, lambda: func(path))
+                    if skipped:
+                        results.append({'benchmark': name, 'params': dict(format=fmt, **params), 'skipped': skipped})
+                        continue
+                results.append(_run(name, lambda: func(path), repeat, warmup, format=fmt, **params))
+    return results
+
+
+def _ocr_skip_reason(missing_tools, func):
+    """Why an OCR case cannot be timed, or None when it recovers text"""
+    if missing_tools:
+        return f"missing OCR tools: {', '.join(missing_tools)}"
+    try:
+        text = func()
+    except Exception as e:
+        return f"OCR failed: {type(e).__name__}: {e}"
+    if not text or not text.strip():
+        return "OCR produced no text"
+    return None
+
+
+def suite_analyzers(entries, repeat, warmup, workers=None, **_):
+    from utils.resume_analyzer import ResumeAnalyzer
+    from utils.resume_document import ResumeDocument
+
+    analyzer = ResumeAnalyzer()
+    requirements = job_requirements()
+    results = []
+    for entry in entries:
+        params = {'pages': entry['pages'], 'skills_density': entry['skills_density']}
+        text = entry['text']
+        results.append(_run(
+            'ResumeAnalyzer.analyze_resume',
+            lambda: analyzer.analyze_resume({'raw_text': ResumeDocument(text)}, requirements),
+            repeat, warmup, **params
+        ))
+
+    texts = [entry['text'] for entry in entries]
+    batch_workers = workers if workers is not None else (os.cpu_count() or 1)
+    results.append(_run(
+        'ResumeAnalyzer.analyze_many',
+        lambda: list(analyzer.analyze_many(texts, requirements, workers=batch_workers)),
+        repeat, warmup, items=len(texts), workers=batch_workers
+    ))
+
+    results.append(_suite_guard('resume_analytics.ResumeAnalyzer.analyze_resume', lambda: _spacy_results(entries, repeat, warmup)))
+    return results
+
+
+def _spacy_results(entries, repeat, warmup):
+    from resume_analytics.analyzer import ResumeAnalyzer as SpacyResumeAnalyzer
+
+    analyzer = SpacyResumeAnalyzer()
+    results = [
+        _run('resume_analytics.ResumeAnalyzer.analyze_resume',
+             lambda text=entry['text']: analyzer.analyze_resume(text),
+             repeat, warmup, pages=entry['pages'], skills_density=entry['skills_density'])
+        for entry in entries
+    ]
+    regex_analyzer = SpacyResumeAnalyzer(mode='regex')
+    results.extend(
+        _run('resume_analytics.ResumeAnalyzer.analyze_resume',
+             lambda text=entry['text']: regex_analyzer.analyze_resume(text),
+             repeat, warmup, mode='regex', pages=entry['pages'], skills_density=entry['skills_density'])
+        for entry in entries
+    )
+    texts = [entry['text'] for entry in entries]
+    results.append(_run('resume_analytics.ResumeAnalyzer.analyze_batch',
+                        lambda: list(analyzer.analyze_batch(texts)),
+                        repeat, warmup, items=len(texts)))
+    return results
+
+
+def suite_ai_parsers(entries, repeat, warmup, **_):
+    from utils.ai_resume_analyzer import AIResumeAnalyzer
+
+    ai = AIResumeAnalyzer()
+    results = []
+    for items in (4, 16):
+        report = corpus_module.ai_report(seed=items, items=items)
+        for name in ('extract_skills_from_analysis', 'extract_missing_skills_from_analysis',
+                     'extract_course_recommendations', 'extract_video_recommendations',
+                     '_extract_score_from_text', '_extract_ats_score_from_text'):
+            method = getattr(ai, name)
+            results.append(_run(f'AIResumeAnalyzer.{name}', lambda: method(report),
+                                repeat, warmup, report_items=items))
+    return results
+
+
+def _ai_result(items=8):
+    report = corpus_module.ai_report(seed=items, items=items)
+    from utils.ai_resume_analyzer import AIResumeAnalyzer
+
+    ai = AIResumeAnalyzer()
+    return {
+        'score': ai._extract_score_from_text(report),
+        'ats_score': ai._extract_ats_score_from_text(report),
+        'strengths': ai.extract_skills_from_analysis(report)[:5],
+        'weaknesses': ai.extract_missing_skills_from_analysis(report)[:5],
+        'suggestions': [],
+        'full_response': report,
+        'analysis': report,
+        'model_used': 'benchmark',
+    }
+
+
+def suite_reports(entries, repeat, warmup, **_):
+    from utils.ai_resume_analyzer import AIResumeAnalyzer
+
+    ai = AIResumeAnalyzer()
+    analysis = _ai_result()
+    return [
+        _run('AIResumeAnalyzer.generate_pdf_report',
+             lambda: ai.generate_pdf_report(analysis, "Benchmark Candidate", "Software Engineer"),
+             repeat, warmup),
+        _run('AIResumeAnalyzer.simple_generate_pdf_report',
+             lambda: ai.simple_generate_pdf_report(analysis, "Benchmark Candidate", "Software Engineer"),
+             repeat, warmup),
+    ]
+
+
+def database_saver(analysis):
+    """Return a function saving one resume and its standard analysis, like the app does"""
+    from config.database import save_analysis_data, save_resume_data
+
+    resume_data = {
+        'personal_info': {key: analysis.get(key, '') for key in ('name', 'email', 'phone', 'linkedin', 'github', 'portfolio')},
+        'summary': analysis.get('summary', ''),
+        'target_role': 'Benchmark',
+        'target_category': 'Benchmark',
+        'education': analysis.get('education', []),
+        'experience': analysis.get('experience', []),
+        'projects': analysis.get('projects', []),
+        'skills': analysis.get('skills', []),
+        'template': '',
+    }
+
+    def save():
+        resume_id = save_resume_data(resume_data)
+        save_analysis_data(resume_id, {
+            'resume_id': resume_id,
+            'ats_score': analysis.get('ats_score', 0),
+            'keyword_match_score': analysis.get('keyword_match', {}).get('score', 0),
+            'format_score': analysis.get('format_score', 0),
+            'section_score': analysis.get('section_score', 0),
+            'missing_skills': ','.join(analysis.get('keyword_match', {}).get('missing_skills', [])),
+            'recommendations': ','.join(analysis.get('suggestions', [])),
+        })
+    return save
+
+
+@contextmanager
+def scratch_database():
+    """Run the block in a temporary working directory holding a fresh database"""
+    # The database lives in the working directory; keep it away from the real one
+    previous = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            from config.database import init_database
+            init_database()
+            yield directory
+        finally:
+            os.chdir(previous)
+
+
+def suite_database(entries, repeat, warmup, **_):
+    from utils.resume_analyzer import ResumeAnalyzer
+
+    analysis = ResumeAnalyzer().analyze_resume({'raw_text': entries[0]['text']}, job_requirements())
+    with scratch_database():
+        return [_run('database.save_resume_and_analysis', database_saver(analysis), repeat, warmup)]
+
+
+SUITES = {
+    'extractors': suite_extractors,
+    'analyzers': suite_analyzers,
+    'ai_parsers': suite_ai_parsers,
+    'reports': suite_reports,
+    'database': suite_database,
+}
+
+
+def _run(name, func, repeat, warmup, items=1, **params):
+    try:
+        return summarize(name, measure(func, repeat, warmup), items=items, **params)
+    except Exception as e:
+        return {'benchmark': name, 'params': params, 'error': f"{type(e).__name__}: {e}"}
+
+
+def _suite_guard(name, func):
+    """Run a suite, turning missing dependencies into a 'skipped' result"""
+    try:
+        return func()
+    except ImportError as e:
+        return {'benchmark': name, 'skipped': f"missing dependency: {e}"}
+    except OSError as e:
+        return {'benchmark': name, 'skipped': str(e)}
+    except Exception as e:
+        traceback.print_exc()
+        return {'benchmark': name, 'error': f"{type(e).__name__}: {e}"}
+
+
+def _flatten(results):
+    flat = []
+    for result in results:
+        if isinstance(result, list):
+            flat.extend(_flatten(result))
+        else:
+            flat.append(result)
+    return flat
+
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(suites=tuple(SUITES), pages=(1, 5, 20), densities=(0.1, 0.5),
+        formats=('pdf', 'docx', 'image_pdf'), repeat=3, warmup=1, workers=None, corpus_dir=None, seed=0):
+    """Generate the corpus, run the selected suites and return the JSON-ready report"""
+    with tempfile.TemporaryDirectory() as scratch:
+        entries = corpus_module.generate_corpus(corpus_dir or scratch, pages, densities, formats, seed)
+        results = []
+        for suite in suites:
+            print(f"Running {suite}...", file=sys.stderr)
+            results.append(_suite_guard(suite, lambda: SUITES[suite](
+                entries, repeat=repeat, warmup=warmup, workers=workers
+            )))
+
+    return {
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'git_revision': _git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'suites': list(suites),
+            'pages': list(pages),
+            'skills_densities': list(densities),
+            'formats': list(formats),
+            'repeat': repeat,
+            'warmup': warmup,
+            'seed': seed,
+            'skipped_formats': {
+                entry['name']: entry['skipped'] for entry in entries if entry['skipped']
+            },
+        },
+        'results': _flatten(results),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the Smart Resume AI benchmarks")
+    parser.add_argument('--suites', nargs='+', default=list(SUITES), choices=list(SUITES))
+    parser.add_argument('--pages', type=int, nargs='+', default=[1, 5, 20])
+    parser.add_argument('--densities', type=float, nargs='+', default=[0.1, 0.5])
+    parser.add_argument('--formats', nargs='+', default=list(corpus_module.WRITERS),
+                        choices=list(corpus_module.WRITERS))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--workers', type=int, default=None, help="workers for analyze_many")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--corpus-dir', default=None, help="keep the generated corpus here")
+    parser.add_argument('--output', default=None, help="write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = run(args.suites, args.pages, args.densities, args.formats, args.repeat,
+                 args.warmup, args.workers, args.corpus_dir, args.seed)
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(payload)
+    else:
+        print(payload)
+
+
+if __name__ == '__main__':
+    main()
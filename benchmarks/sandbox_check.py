@@ -0,0 +1,79 @@
+"""
+Check that the extraction sandbox enforces its memory budget.
+
+Builds a PDF whose pages carry very large content streams and parses it in
+utils.extraction_sandbox with a small memory budget, which must stop with the
+'memory' outcome; a small PDF under the default budget must be read completely:
+
+    python -m benchmarks.sandbox_check
+    python -m benchmarks.sandbox_check --budget-mb 16 --operators 400000
+"""
+
+import argparse
+import sys
+
+
+def heavy_pdf(pages=2, operators=200000):
+    """Return the bytes of an uncompressed PDF with `operators` text-showing operators per page"""
+    content = b"BT /F1 8 Tf 36 800 Td\n" + b"(word ) Tj\n" * operators + b"ET\n"
+    page_ids = [4 + 2 * i for i in range(pages)]
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [" + b" ".join(b"%d 0 R" % page_id for page_id in page_ids)
+        + b"] /Count %d >>" % pages,
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for page_id in page_ids:
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+                       b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (page_id + 1))
+        objects.append(b"<< /Length %d >>\nstream\n" % len(content) + content + b"endstream")
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    output += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(output)
+
+
+def run_extraction(pdf, backend, memory_limit_mb):
+    from utils.extraction_sandbox import SandboxedPdfExtraction
+
+    extraction = SandboxedPdfExtraction(pdf, backend, memory_limit_mb=memory_limit_mb)
+    pages = list(extraction)
+    return pages, extraction.budget_exceeded
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check the extraction sandbox memory budget")
+    parser.add_argument('--backend', default='pypdf', choices=['pypdf', 'pdfplumber'])
+    parser.add_argument('--budget-mb', type=int, default=16, help="budget the heavy PDF must exceed")
+    parser.add_argument('--operators', type=int, default=200000, help="text operators per page")
+    args = parser.parse_args(argv)
+
+    failures = []
+    pages, exceeded = run_extraction(heavy_pdf(2, args.operators), args.backend, args.budget_mb)
+    reason = exceeded and exceeded['reason']
+    print(f"heavy PDF, {args.budget_mb} MB budget: {reason or 'completed'} after {len(pages)} page(s)")
+    if reason != 'memory':
+        failures.append(f"expected the 'memory' outcome, got {reason or 'a complete parse'}")
+
+    from utils.extraction_sandbox import EXTRACTION_MEMORY_LIMIT_MB
+
+    pages, exceeded = run_extraction(heavy_pdf(2, 50), args.backend, EXTRACTION_MEMORY_LIMIT_MB)
+    print(f"small PDF, {EXTRACTION_MEMORY_LIMIT_MB} MB budget: {exceeded['reason'] if exceeded else 'completed'} "
+          f"after {len(pages)} page(s)")
+    if exceeded or len(pages) != 2 or 'word' not in "".join(pages):
+        failures.append("expected the small PDF to be read completely")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,24 @@
+import os
+
+# Skills the resume analytics look for. Entries are matched case-insensitively on
+# token boundaries and may be phrases of any length.
+TECH_SKILLS = [
+    "python", "java", "javascript", "react", "node.js", "sql",
+    "html", "css", "aws", "docker", "kubernetes", "git",
+    "machine learning", "ai", "data science", "analytics",
+]
+
+# Optional text file with more skills, one per line (lines starting with '#' are ignored)
+SKILLS_FILE = os.getenv("SKILLS_FILE")
+
+
+def load_skills(path=SKILLS_FILE):
+    """Return the skill catalog: TECH_SKILLS plus the skills listed in path, lowercased and deduplicated"""
+    skills = list(TECH_SKILLS)
+    if path:
+        try:
+            with open(path, encoding='utf-8') as f:
+                skills.extend(line.strip() for line in f if not line.lstrip().startswith('#'))
+        except OSError as e:
+            print(f"Could not read skills file {path}: {e}")
+    return list(dict.fromkeys(skill.lower() for skill in skills if skill))
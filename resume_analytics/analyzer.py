@@ -1,25 +1,127 @@
-import spacy
-from collections import Counter
+import os
+import time
+from collections import Counter, deque
 from datetime import datetime
+from utils.resume_document import as_document
+from .nlp import (
+    SPACY_BATCH_SIZE, SPACY_MODEL, SPACY_N_PROCESS, SPACY_SENTENCES,
+    get_experience_matcher, get_nlp, get_skill_matcher,
+)
+from . import fast_metrics
+from .doc_cache import get_doc_cache
+
+# "spacy" runs the NLP pipeline; "regex" computes the same metrics with regular
+# expressions only, which is much cheaper and close enough for profile scores
+ANALYTICS_MODE = os.getenv("ANALYTICS_MODE", "spacy")
 
 class ResumeAnalyzer:
-    def __init__(self):
-        self.nlp = spacy.load("en_core_web_sm")
+    def __init__(self, model=SPACY_MODEL, sentences=SPACY_SENTENCES, mode=ANALYTICS_MODE):
+        if mode not in ('spacy', 'regex'):
+            raise ValueError(f"Unknown analytics mode: {mode!r}")
+        self.model = model
+        self.sentences = sentences
+        self.mode = mode
+        self.doc_cache = get_doc_cache()
+        self.last_batch_stats = None
+
+    @property
+    def nlp(self):
+        """The shared spaCy pipeline, loaded on first use"""
+        return get_nlp(self.model, self.sentences)
+
+    def parse(self, resume_text):
+        """Return the spaCy Doc of a resume, from the Doc cache when it was parsed before"""
+        document = as_document(resume_text)
+        doc = self.doc_cache.get(self.nlp, document)
+        if doc is None:
+            doc = self.nlp(document.text)
+            self.doc_cache.set(self.nlp, document, doc)
+        return doc
+
+    def iter_docs(self, texts, batch_size=SPACY_BATCH_SIZE, n_process=SPACY_N_PROCESS):
+        """
+        Yield (ResumeDocument, Doc) for every text, in order.
+
+        Cached Docs are loaded from the Doc cache; only the rest go through nlp.pipe,
+        and their Docs are added to the cache.
+        """
+        nlp, cache = self.nlp, self.doc_cache
+        # Every text read so far, with its cached bytes (None for texts being parsed)
+        pending = deque()
+
+        def misses():
+            for document in map(as_document, texts):
+                data = cache.get_bytes(nlp, document)
+                pending.append((document, data))
+                if data is None:
+                    yield document.text, document
+
+        def flush_hits():
+            while pending and pending[0][1] is not None:
+                document, data = pending.popleft()
+                doc = cache.load(nlp, document, data)
+                yield document, doc if doc is not None else nlp(document.text)
+
+        for doc, document in nlp.pipe(misses(), as_tuples=True, batch_size=batch_size, n_process=n_process):
+            yield from flush_hits()
+            pending.popleft()
+            cache.set(nlp, document, doc)
+            yield document, doc
+        yield from flush_hits()
         
     def analyze_resume(self, resume_text):
-        """Analyze resume text and return metrics"""
-        doc = self.nlp(resume_text)
-        
-        # Basic metrics
-        word_count = len(resume_text.split())
-        sentence_count = len(list(doc.sents))
-        
-        # Skills extraction
-        skills = self._extract_skills(doc)
-        
-        # Experience analysis
-        experience_years = self._analyze_experience(doc)
-        
+        """Analyze resume text (a string or ResumeDocument) and return metrics"""
+        document = as_document(resume_text)
+        if self.mode == 'regex':
+            return self._analyze_text(document)
+        return self._analyze_doc(document, self.parse(document))
+
+    def analyze_batch(self, texts, batch_size=SPACY_BATCH_SIZE, n_process=SPACY_N_PROCESS):
+        """
+        Analyze many resumes through nlp.pipe, yielding one result per text in order.
+
+        n_process > 1 parses in worker processes (ignored in regex mode). When the
+        generator is exhausted the throughput is printed and kept in self.last_batch_stats.
+        """
+        start = time.perf_counter()
+        documents = map(as_document, texts)
+        if self.mode == 'regex':
+            results = map(self._analyze_text, documents)
+        else:
+            results = (
+                self._analyze_doc(document, doc)
+                for document, doc in self.iter_docs(documents, batch_size, n_process)
+            )
+        count = 0
+        for result in results:
+            count += 1
+            yield result
+
+        seconds = time.perf_counter() - start
+        self.last_batch_stats = {
+            "documents": count,
+            "seconds": seconds,
+            "docs_per_second": count / seconds if seconds else 0.0,
+        }
+        print(f"Analyzed {count} resumes in {seconds:.2f}s "
+              f"({self.last_batch_stats['docs_per_second']:.1f} docs/s)")
+
+    def _analyze_doc(self, document, doc):
+        """Compute the metrics of one resume from its text and parsed Doc"""
+        return self._build_result(
+            document.word_count, len(list(doc.sents)),
+            self._extract_skills(doc), self._analyze_experience(doc)
+        )
+
+    def _analyze_text(self, document):
+        """Compute the same metrics as _analyze_doc with regexes only"""
+        text = document.text
+        return self._build_result(
+            document.word_count, fast_metrics.sentence_count(text),
+            fast_metrics.extract_skills(text), fast_metrics.experience_years(text)
+        )
+
+    def _build_result(self, word_count, sentence_count, skills, experience_years):
         # Calculate profile score
         profile_score = self._calculate_profile_score(
             word_count, sentence_count, len(skills), experience_years
@@ -41,38 +143,19 @@ class ResumeAnalyzer:
         }
     
     def _extract_skills(self, doc):
-        """Extract skills from resume"""
-        # Common technical skills keywords
-        tech_skills = {
-            "python", "java", "javascript", "react", "node.js", "sql",
-            "html", "css", "aws", "docker", "kubernetes", "git",
-            "machine learning", "ai", "data science", "analytics"
-        }
-        
-        skills = set()
-        for token in doc:
-            if token.text.lower() in tech_skills:
-                skills.add(token.text)
-            # Check for compound skills (e.g., "machine learning")
-            if token.i < len(doc) - 1:
-                bigram = (token.text + " " + doc[token.i + 1].text).lower()
-                if bigram in tech_skills:
-                    skills.add(bigram)
-        
-        return skills
+        """Extract catalog skills (config.skills) mentioned in the resume"""
+        strings = doc.vocab.strings
+        return {strings[match_id] for match_id, _, _ in get_skill_matcher(self.nlp)(doc)}
     
     def _analyze_experience(self, doc):
         """Analyze years of experience"""
         # Simple heuristic - look for number + "years"
         experience_years = 0
-        for token in doc:
-            if token.like_num and token.i < len(doc) - 1:
-                next_token = doc[token.i + 1]
-                if "year" in next_token.text.lower():
-                    try:
-                        experience_years = max(experience_years, int(token.text))
-                    except ValueError:
-                        continue
+        for _, start, _ in get_experience_matcher(self.nlp)(doc):
+            try:
+                experience_years = max(experience_years, int(doc[start].text))
+            except ValueError:
+                continue
         return experience_years
     
     def _calculate_profile_score(self, word_count, sentence_count, skills_count, experience_years):
@@ -0,0 +1,93 @@
+import hashlib
+import os
+import threading
+
+from utils.disk_cache import DiskCache
+from utils.resume_document import as_document
+
+# Where parsed spaCy Docs are kept and how much disk they may use
+DOC_CACHE_DIR = os.getenv("DOC_CACHE_DIR", os.path.join(".cache", "spacy-docs"))
+DOC_CACHE_MAX_BYTES = int(os.getenv("DOC_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+DOC_CACHE_ENABLED = os.getenv("DOC_CACHE_ENABLED", "1") != "0"
+
+
+def model_version(nlp):
+    """Identify a pipeline: spaCy version, model name and version, and the components it runs"""
+    import spacy
+
+    meta = nlp.meta
+    return (f"{spacy.__version__}:{meta.get('lang')}_{meta.get('name')}-{meta.get('version')}:"
+            f"{','.join(nlp.pipe_names)}")
+
+
+def doc_key(text, version):
+    """Build the cache key for text (a string or ResumeDocument) parsed by the pipeline identified by version"""
+    return hashlib.sha256(f"{version}:{as_document(text).sha256}".encode('utf-8')).hexdigest()
+
+
+class DocCache:
+    """Parsed spaCy Docs stored as DocBin bytes, keyed by text hash and model version"""
+
+    def __init__(self, directory=DOC_CACHE_DIR, max_bytes=DOC_CACHE_MAX_BYTES):
+        self.store = DiskCache(directory, max_bytes=max_bytes)
+
+    def get_bytes(self, nlp, text):
+        """Return the serialized Doc of text for this pipeline, or None"""
+        return self.store.get_bytes(doc_key(text, model_version(nlp)))
+
+    def load(self, nlp, text, data):
+        """Turn bytes from get_bytes back into a Doc; a corrupt entry is dropped and gives None"""
+        from spacy.tokens import DocBin
+
+        try:
+            return next(DocBin().from_bytes(data).get_docs(nlp.vocab))
+        except Exception as e:
+            print(f"Dropping unreadable cached Doc: {e}")
+            self.store.delete(doc_key(text, model_version(nlp)))
+            return None
+
+    def get(self, nlp, text):
+        """Return the cached Doc of text for this pipeline, or None"""
+        data = self.get_bytes(nlp, text)
+        return self.load(nlp, text, data) if data is not None else None
+
+    def set(self, nlp, text, doc):
+        """Remember the Doc nlp produced for text"""
+        from spacy.tokens import DocBin
+
+        self.store.set_bytes(doc_key(text, model_version(nlp)), DocBin(docs=[doc]).to_bytes())
+
+
+class _NullDocCache:
+    def get_bytes(self, nlp, text):
+        return None
+
+    def load(self, nlp, text, data):
+        return None
+
+    def get(self, nlp, text):
+        return None
+
+    def set(self, nlp, text, doc):
+        pass
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_doc_cache():
+    """Return the process-wide Doc cache"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                if not DOC_CACHE_ENABLED:
+                    _cache = _NullDocCache()
+                else:
+                    try:
+                        _cache = DocCache()
+                    except OSError as e:
+                        print(f"Doc cache disabled: {e}")
+                        _cache = _NullDocCache()
+    return _cache
@@ -0,0 +1,47 @@
+"""
+spaCy-free resume metrics.
+
+Regex versions of the counts the profile score needs, written to agree with the
+spaCy path (tokenizer, sentencizer and the matchers in resume_analytics.nlp) on
+ordinary resume text. They differ on edge cases such as abbreviations ("e.g.") that
+spaCy keeps as one token; benchmarks.parity checks how close the two paths are.
+"""
+
+import functools
+import re
+
+# A sentence ends at ., ! or ? followed by whitespace
+SENTENCE_BREAK = re.compile(r'(?<=[.!?])\s+')
+# A standalone number, one space, then a word containing "year" ("5 years", "10 Years")
+EXPERIENCE_YEARS = re.compile(r'(?<![\w.,])(\d+) [a-z]*year', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=8)
+def skill_pattern(skills):
+    """Compile one alternation over a tuple of lowercase skills, longest first"""
+    alternatives = sorted(skills, key=len, reverse=True)
+    return re.compile(
+        r'(?<!\w)(?:' + '|'.join(re.escape(skill) for skill in alternatives) + r')(?!\w)',
+        re.IGNORECASE
+    )
+
+
+def sentence_count(text):
+    return sum(1 for sentence in SENTENCE_BREAK.split(text) if sentence.strip())
+
+
+@functools.lru_cache(maxsize=1)
+def _catalog_pattern():
+    from config.skills import load_skills
+    return skill_pattern(tuple(load_skills()))
+
+
+def extract_skills(text, skills=None):
+    """Return the names of the skills (default: the config.skills catalog) mentioned in text"""
+    pattern = skill_pattern(tuple(skills)) if skills is not None else _catalog_pattern()
+    return {match.group().lower() for match in pattern.finditer(text)}
+
+
+def experience_years(text):
+    """Return the largest "N years" mention, or 0"""
+    return max((int(match.group(1)) for match in EXPERIENCE_YEARS.finditer(text)), default=0)
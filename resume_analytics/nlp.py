@@ -0,0 +1,108 @@
+"""
+Process-wide spaCy model registry.
+
+The resume analytics only read tokens, lexical attributes such as ``like_num`` and
+sentence boundaries, so models are loaded without the tagger, lemmatizer and NER,
+and by default the dependency parser is replaced by the rule-based sentencizer. Each
+configuration is loaded once, on first use, and the same Language object is handed
+to every analyzer; spaCy pipelines can be called from several threads at once.
+"""
+
+import os
+import threading
+
+# Which spaCy model the analytics use
+SPACY_MODEL = os.getenv("SPACY_MODEL", "en_core_web_sm")
+# How sentences are split: "sentencizer" (punctuation rules, fast) or "parser"
+# (the model's dependency parser, slower but better on unpunctuated text)
+SPACY_SENTENCES = os.getenv("SPACY_SENTENCES", "sentencizer")
+# Defaults for batch analysis with nlp.pipe
+SPACY_BATCH_SIZE = int(os.getenv("SPACY_BATCH_SIZE", "64"))
+SPACY_N_PROCESS = int(os.getenv("SPACY_N_PROCESS", "1"))
+
+# Components the analytics never read
+_UNUSED_PIPES = ['tagger', 'attribute_ruler', 'lemmatizer', 'ner', 'senter']
+
+_models = {}
+_matchers = {}
+_models_lock = threading.Lock()
+
+
+def load_model(name=SPACY_MODEL, sentences=SPACY_SENTENCES):
+    """Load a trimmed pipeline; use get_nlp() to share one instead"""
+    import spacy
+
+    if sentences == 'parser':
+        # The parser listens to the shared tok2vec, so that has to stay
+        return spacy.load(name, exclude=_UNUSED_PIPES)
+    if sentences != 'sentencizer':
+        raise ValueError(f"Unknown sentence splitting mode: {sentences!r}")
+    nlp = spacy.load(name, exclude=_UNUSED_PIPES + ['parser', 'tok2vec'])
+    nlp.add_pipe('sentencizer')
+    return nlp
+
+
+def get_nlp(name=SPACY_MODEL, sentences=SPACY_SENTENCES):
+    """Return the process-wide pipeline for this model and sentence mode, loading it once"""
+    key = (name, sentences)
+    nlp = _models.get(key)
+    if nlp is None:
+        with _models_lock:
+            nlp = _models.get(key)
+            if nlp is None:
+                nlp = _models[key] = load_model(name, sentences)
+    return nlp
+
+
+def _cached_matcher(nlp, kind, build):
+    key = (id(nlp), kind)
+    entry = _matchers.get(key)
+    if entry is None:
+        with _models_lock:
+            entry = _matchers.get(key)
+            if entry is None:
+                # Keep nlp alive with its matcher so the id cannot be reused
+                entry = _matchers[key] = (nlp, build(nlp))
+    return entry[1]
+
+
+def _build_skill_matcher(nlp):
+    from spacy.matcher import PhraseMatcher
+    from config.skills import load_skills
+
+    matcher = PhraseMatcher(nlp.vocab, attr='LOWER')
+    skills = load_skills()
+    for skill, pattern in zip(skills, nlp.tokenizer.pipe(skills)):
+        matcher.add(skill, [pattern])
+    return matcher
+
+
+def _build_experience_matcher(nlp):
+    from spacy.matcher import Matcher
+
+    matcher = Matcher(nlp.vocab)
+    # "5 years", "10 Years" style mentions: a number followed by a word containing "year"
+    matcher.add('YEARS', [[{'LIKE_NUM': True}, {'LOWER': {'REGEX': 'year'}}]])
+    return matcher
+
+
+def get_skill_matcher(nlp):
+    """
+    Return the PhraseMatcher over the skill catalog (config.skills) for nlp.
+
+    Every skill is its own match id, so nlp.vocab.strings[match_id] is the catalog
+    name of the skill found. Built once per pipeline.
+    """
+    return _cached_matcher(nlp, 'skills', _build_skill_matcher)
+
+
+def get_experience_matcher(nlp):
+    """Return the Matcher for "N years" mentions for nlp, built once per pipeline"""
+    return _cached_matcher(nlp, 'experience', _build_experience_matcher)
+
+
+def clear_models():
+    """Forget every loaded pipeline and matcher (they are rebuilt on next use)"""
+    with _models_lock:
+        _models.clear()
+        _matchers.clear()
@@ -1,10 +1,35 @@
 """
 Utils package for Smart Resume AI
+
+The analyzers and builders are imported on first access, so importing a light
+submodule (e.g. utils.extraction_sandbox in a parser child process) does not pull in
+streamlit, the LLM clients and the database layer.
 """
 
-from .resume_analyzer import ResumeAnalyzer
-from .resume_builder import ResumeBuilder
-from .resume_parser import ResumeParser
-from .excel_manager import ExcelManager
-from .database import * 
-from .ai_resume_analyzer import AIResumeAnalyzer
\ No newline at end of file
+import importlib
+import importlib.util
+
+_LAZY_ATTRIBUTES = {
+    'ResumeAnalyzer': '.resume_analyzer',
+    'ResumeBuilder': '.resume_builder',
+    'ResumeParser': '.resume_parser',
+    'ExcelManager': '.excel_manager',
+    'AIResumeAnalyzer': '.ai_resume_analyzer',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    elif name.startswith('_') or importlib.util.find_spec(f"{__name__}.{name}") is not None:
+        # Submodules are left to the import system
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    else:
+        # Everything utils.database exports, as the former `from .database import *`
+        database = importlib.import_module('.database', __name__)
+        try:
+            value = getattr(database, name)
+        except AttributeError:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    globals()[name] = value
+    return value
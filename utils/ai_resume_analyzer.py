@@ -2,18 +2,34 @@ import os
 import streamlit as st
 from dotenv import load_dotenv
 import google.generativeai as genai
-import pdfplumber
-from pdf2image import convert_from_path
-import pytesseract
-import tempfile
 import requests
 import json
 import math
-import re
+from .docx_extraction import iter_docx_lines
+from .extraction_cache import get_extraction_cache
+from .extraction_sandbox import (EXTRACTION_MAX_PAGES, EXTRACTION_SANDBOX, EXTRACTION_TIMEOUT_SECONDS,
+                                 ExtractionBudgetExceeded, SandboxedPdfExtraction, budget_exceeded, sandboxed_call)
+from .pdf_extraction import extract_pdf_pages
+from .ocr import merge_ocr_pages, ocr_pages, pages_needing_ocr
+from . import patterns
+from .patterns import clean_markdown
+from .pdf_triage import record_triage_decision, scanned_pages, triage_pdf
+from .resume_document import as_text
+from .timing import TIMING_DEBUG, collect_spans, span, spans_to_timings, timed
+from .upload import UploadedDocument
 
 
 class AIResumeAnalyzer:
+    # Bump whenever extraction output changes so cached text is not reused
+    EXTRACTOR_VERSION = 5
+
     def __init__(self):
+        self.cache = get_extraction_cache()
+        # Backend decision for the last PDF, see utils.pdf_triage
+        self.last_triage = None
+        # Why extraction of the last PDF stopped early, see utils.extraction_sandbox
+        self.last_budget_exceeded = None
+        
         # Load environment variables
         load_dotenv()
         
@@ -24,163 +40,248 @@ class AIResumeAnalyzer:
         if self.google_api_key:
             genai.configure(api_key=self.google_api_key)
     
+    @timed('ai.extract.pdf')
     def extract_text_from_pdf(self, pdf_file):
         """Extract text from PDF using pdfplumber and OCR if needed"""
-        text = ""
+        document = UploadedDocument.from_upload(pdf_file)
+        self.last_budget_exceeded = None
+        cached = self.cache.get(document, 'ai_resume_analyzer.pdf', self.EXTRACTOR_VERSION)
+        if cached:
+            return cached['text']
         
-        # Save the uploaded file to a temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-            if hasattr(pdf_file, 'getbuffer'):
-                temp_file.write(pdf_file.getbuffer())
-            elif hasattr(pdf_file, 'read'):
-                temp_file.write(pdf_file.read())
-                pdf_file.seek(0)  # Reset file pointer
-            else:
-                # If it's already bytes
-                temp_file.write(pdf_file)
-            temp_path = temp_file.name
+        text, backend = self._extract_text_from_pdf_document(document)
+        if not self.last_budget_exceeded:
+            # Partial text from a budget-limited run must not be served for the whole file
+            self.cache.set(document, 'ai_resume_analyzer.pdf', self.EXTRACTOR_VERSION, text, backend)
+        return text
+    
+    def _extract_text_from_pdf_document(self, document):
+        """Extract the text layer page by page, OCR only sparse pages and return (text, backend)"""
+        pages = []
+        backend = None
         
         try:
-            # Try direct text extraction with pdfplumber
-            try:
-                with pdfplumber.open(temp_path) as pdf:
-                    for page in pdf.pages:
-                        try:
-                            # Suppress specific warnings about PDFColorSpace conversion
-                            import warnings
-                            with warnings.catch_warnings():
-                                warnings.filterwarnings("ignore", message=".*PDFColorSpace.*")
-                                warnings.filterwarnings("ignore", message=".*Cannot convert.*")
-                                page_text = page.extract_text()
-                                if page_text:
-                                    text += page_text + "\n"
-                        except Exception as e:
-                            # Don't show these specific errors to the user
-                            if "PDFColorSpace" not in str(e) and "Cannot convert" not in str(e):
-                                st.warning(f"Error extracting text from page with pdfplumber: {e}")
-            except Exception as e:
-                st.warning(f"pdfplumber extraction failed: {e}")
-            
-            # If pdfplumber extraction worked, return the text
-            if text.strip():
-                os.unlink(temp_path)  # Clean up the temp file
-                return text.strip()
-            
-            # Try PyPDF2 as a fallback
-            st.info("Trying PyPDF2 extraction method...")
+            # Pick the backend from a cheap look at the first pages instead of running
+            # every extractor over the whole file in turn
             try:
-                import pypdf
-                pdf_text = ""
-                with open(temp_path, 'rb') as file:
-                    pdf_reader = pypdf.PdfReader(file)
-                    for page in pdf_reader.pages:
-                        page_text = page.extract_text()
-                        if page_text:
-                            pdf_text += page_text + "\n"
-                
-                if pdf_text.strip():
-                    os.unlink(temp_path)  # Clean up the temp file
-                    return pdf_text.strip()
+                with span('ai.triage'):
+                    triage = self._triage(document)
+            except ExtractionBudgetExceeded as e:
+                # A document that exhausts the budget on its first pages will not parse in full
+                self._report_budget(e.budget)
+                triage = {'backend': None, 'reason': f"triage stopped: {e}", 'page_count': None}
             except Exception as e:
-                st.warning(f"PyPDF2 extraction failed: {e}")
-            
-            # If we got here, both extraction methods failed
-            st.warning("Standard text extraction methods failed. Your PDF might be image-based or scanned.")
-            
-            # Try OCR as a last resort
-            try:
-                # Check if we can import the required OCR libraries
-                import pytesseract
-                from pdf2image import convert_from_path
-                
-                st.info("Attempting OCR for image-based PDF. This may take a moment...")
-                
-                # Check if poppler is installed
-                poppler_path = None
-                if os.name == 'nt':  # Windows
-                    # Try to find poppler in common locations
-                    possible_paths = [
-                        r'C:\poppler\Library\bin',
-                        r'C:\Program Files\poppler\bin',
-                        r'C:\Program Files (x86)\poppler\bin',
-                        r'C:\poppler\bin'
-                    ]
-                    for path in possible_paths:
-                        if os.path.exists(path):
-                            poppler_path = path
-                            st.success(f"Found Poppler at: {path}")
-                            break
-                    
-                    if not poppler_path:
-                        st.warning("Poppler not found in common locations. Using default path: C:\\poppler\\Library\\bin")
-                        poppler_path = r'C:\poppler\Library\bin'
-                
-                # Try to convert PDF to images
-                try:
-                    if poppler_path and os.name == 'nt':
-                        images = convert_from_path(temp_path, poppler_path=poppler_path)
-                    else:
-                        images = convert_from_path(temp_path)
-                    
-                    # Process each image with OCR
-                    ocr_text = ""
-                    for i, image in enumerate(images):
-                        st.info(f"Processing page {i+1} with OCR...")
-                        page_text = pytesseract.image_to_string(image)
-                        ocr_text += page_text + "\n"
-                    
-                    if ocr_text.strip():
-                        os.unlink(temp_path)  # Clean up the temp file
-                        return ocr_text.strip()
-                    else:
-                        st.error("OCR extraction yielded no text. Please check if the PDF contains actual text content.")
-                except Exception as e:
-                    st.error(f"PDF to image conversion failed: {e}")
-                    st.info("If you're on Windows, make sure Poppler is installed and in your PATH.")
-                    st.info("Download Poppler from: https://github.com/oschwartz10612/poppler-windows/releases/")
-            except ImportError as e:
-                st.error(f"OCR libraries not available: {e}")
-                st.info("Please install the required OCR libraries:")
-                st.code("pip install pytesseract pdf2image")
-                st.info("For Windows, also download and install:")
-                st.info("1. Tesseract OCR: https://github.com/UB-Mannheim/tesseract/wiki")
-                st.info("2. Poppler: https://github.com/oschwartz10612/poppler-windows/releases/")
-            except Exception as e:
-                st.error(f"OCR processing failed: {e}")
+                triage = {'backend': 'layout', 'reason': f"triage failed: {e}", 'page_count': None}
+            self.last_triage = triage
+            
+            if triage['backend'] == 'ocr':
+                # Scanned upload: go straight to OCR without parsing the text layer
+                page_count = triage['page_count']
+                pages, backend = self._ocr_sparse_pages(
+                    document, [""] * page_count, list(range(page_count)) if page_count else None, None,
+                    fallback=True,
+                )
+                if not any(page_text.strip() for page_text in pages):
+                    # OCR is unavailable or found nothing; triage only sampled the first
+                    # pages, so read the text layer before giving up
+                    pages, backend = self._extract_text_layers(
+                        document, ['pdfplumber', 'pypdf'], page_count
+                    )
+            elif triage['backend']:
+                # pypdf is the fast path for clean text layers, pdfplumber decodes harder fonts;
+                # the other one is only tried if the chosen backend finds no text at all
+                order = ['pypdf', 'pdfplumber'] if triage['backend'] == 'text' else ['pdfplumber', 'pypdf']
+                pages, backend = self._extract_text_layers(document, order, triage.get('page_count'))
+                
+                # OCR only the pages that lack a usable text layer
+                sparse_pages = pages_needing_ocr(pages) if pages else None
+                if sparse_pages:
+                    try:
+                        if EXTRACTION_SANDBOX:
+                            sparse_pages = sandboxed_call(scanned_pages, document, sparse_pages)
+                        else:
+                            sparse_pages = scanned_pages(document, sparse_pages)
+                    except Exception as e:
+                        print(f"Could not inspect page resources, OCR'ing all sparse pages: {e}")
+                if sparse_pages is None or sparse_pages:
+                    pages, backend = self._ocr_sparse_pages(document, pages, sparse_pages, backend)
         
         except Exception as e:
             st.error(f"PDF processing failed: {e}")
         
-        # Clean up the temp file
-        try:
-            os.unlink(temp_path)
-        except:
-            pass
+        text = "\n".join(page_text for page_text in pages if page_text).strip()
+        if text:
+            return text, backend
         
         # If all extraction methods failed, return an empty string
         st.error("All text extraction methods failed. Please try a different PDF or manually extract the text.")
-        return ""
+        return "", None
+    
+    def _triage(self, document):
+        """Run triage_pdf, in a supervised child process when the extraction sandbox is on"""
+        if not EXTRACTION_SANDBOX:
+            return triage_pdf(document)
+        triage = sandboxed_call(triage_pdf, document)
+        record_triage_decision(triage)  # The child's counters go away with it
+        return triage
+    
+    def _extract_text_layers(self, document, order, page_count):
+        """Try the backends in order and return (pages, backend) from the first that finds text"""
+        pages, backend = [], None
+        for candidate in order:
+            try:
+                candidate_pages, errors, budget = self._extract_text_layer(document, candidate, page_count)
+            except Exception as e:
+                st.warning(f"{candidate} extraction failed: {e}")
+                continue
+            for error in errors:
+                # Don't show these specific errors to the user
+                if "PDFColorSpace" not in error and "Cannot convert" not in error:
+                    st.warning(f"Error extracting text from page with {candidate}: {error}")
+            if any(page_text.strip() for page_text in candidate_pages):
+                return candidate_pages, candidate
+            if not pages:
+                pages = candidate_pages
+            if budget:
+                break  # The other parser would spend the same budget again
+        return pages, backend
+    
+    def _extract_text_layer(self, document, backend, page_count):
+        """Return (pages, errors, budget_exceeded) for one backend, sandboxed when the sandbox is on"""
+        if not EXTRACTION_SANDBOX:
+            pages, errors = extract_pdf_pages(document, backend, page_count=page_count)
+            return pages, errors, None
+        extraction = SandboxedPdfExtraction(document, backend)
+        pages = list(extraction)
+        if extraction.budget_exceeded:
+            self._report_budget(extraction.budget_exceeded)
+        return pages, [], extraction.budget_exceeded
+    
+    def _report_budget(self, budget):
+        self.last_budget_exceeded = budget
+        st.warning(f"⚠️ {budget['message']}. The analysis only covers the text extracted so far.")
     
+    def _find_poppler_path(self):
+        """Locate Poppler on Windows; other platforms rely on PATH"""
+        if os.name != 'nt':
+            return None
+        
+        # Try to find poppler in common locations
+        possible_paths = [
+            r'C:\poppler\Library\bin',
+            r'C:\Program Files\poppler\bin',
+            r'C:\Program Files (x86)\poppler\bin',
+            r'C:\poppler\bin'
+        ]
+        for path in possible_paths:
+            if os.path.exists(path):
+                st.success(f"Found Poppler at: {path}")
+                return path
+        
+        st.warning("Poppler not found in common locations. Using default path: C:\\poppler\\Library\\bin")
+        return r'C:\poppler\Library\bin'
+    
+    @timed('ai.ocr')
+    def _ocr_sparse_pages(self, document, pages, sparse_pages, backend, fallback=False):
+        """
+        OCR the pages without a usable text layer and merge them with the text-layer pages.
+        
+        sparse_pages is a list of zero-based page indices, or None to OCR every page
+        when no text layer could be read at all. With fallback=True the caller still
+        has the text layer to try, so OCR failures are only logged.
+        """
+        # Other pages already have text, so an OCR failure only loses the scanned ones
+        partial = sparse_pages is not None and any(page_text.strip() for page_text in pages)
+        if sparse_pages is None or len(sparse_pages) == len(pages):
+            st.warning("Standard text extraction methods failed. Your PDF might be image-based or scanned.")
+            st.info("Attempting OCR for image-based PDF. This may take a moment...")
+        else:
+            st.info(f"Running OCR on {len(sparse_pages)} page(s) without a text layer...")
+        
+        try:
+            # Check if we can import the required OCR libraries
+            import pytesseract  # noqa: F401
+            import pdf2image  # noqa: F401
+        except ImportError as e:
+            if fallback:
+                print(f"OCR libraries not available, reading the text layer instead: {e}")
+                return pages, backend
+            if partial:
+                return self._skip_partial_ocr(pages, sparse_pages, backend, e)
+            st.error(f"OCR libraries not available: {e}")
+            st.info("Please install the required OCR libraries:")
+            st.code("pip install pytesseract pdf2image")
+            st.info("For Windows, also download and install:")
+            st.info("1. Tesseract OCR: https://github.com/UB-Mannheim/tesseract/wiki")
+            st.info("2. Poppler: https://github.com/oschwartz10612/poppler-windows/releases/")
+            return pages, backend
+        
+        poppler_path = self._find_poppler_path()
+        try:
+            # Poppler needs a real file, so this is the only place the upload touches disk
+            with document.as_path(suffix='.pdf') as pdf_path:
+                if sparse_pages is None:
+                    from pdf2image import pdfinfo_from_path
+                    page_count = pdfinfo_from_path(pdf_path, poppler_path=poppler_path)['Pages']
+                    pages = [""] * page_count
+                    sparse_pages = list(range(page_count))
+                if EXTRACTION_SANDBOX and len(pages) > EXTRACTION_MAX_PAGES:
+                    pages = pages[:EXTRACTION_MAX_PAGES]
+                    sparse_pages = [index for index in sparse_pages if index < EXTRACTION_MAX_PAGES]
+                    self._report_budget(budget_exceeded('page_limit', EXTRACTION_MAX_PAGES))
+                ocr_results = ocr_pages(
+                    pdf_path, sparse_pages, poppler_path=poppler_path,
+                    timeout=EXTRACTION_TIMEOUT_SECONDS if EXTRACTION_SANDBOX else None,
+                )
+        except TimeoutError:
+            self._report_budget(budget_exceeded('timeout', EXTRACTION_TIMEOUT_SECONDS))
+            return pages, backend
+        except Exception as e:
+            if fallback:
+                print(f"OCR failed, reading the text layer instead: {e}")
+                return pages, backend
+            if partial:
+                return self._skip_partial_ocr(pages, sparse_pages, backend, e)
+            st.error(f"PDF to image conversion failed: {e}")
+            st.info("If you're on Windows, make sure Poppler is installed and in your PATH.")
+            st.info("Download Poppler from: https://github.com/oschwartz10612/poppler-windows/releases/")
+            return pages, backend
+        
+        merged = merge_ocr_pages(pages, ocr_results)
+        replaced = sum(1 for before, after in zip(pages, merged) if before != after)
+        if not replaced:
+            if not fallback and not any(page_text.strip() for page_text in merged):
+                st.error("OCR extraction yielded no text. Please check if the PDF contains actual text content.")
+            return merged, backend
+        
+        if replaced == len(merged) or not backend:
+            return merged, 'ocr'
+        return merged, f"{backend}+ocr"
+    
+    def _skip_partial_ocr(self, pages, sparse_pages, backend, error):
+        """Keep the text-layer pages when OCR of the remaining scanned pages is unavailable"""
+        print(f"OCR of {len(sparse_pages)} scanned page(s) skipped: {error}")
+        st.info(f"{len(sparse_pages)} scanned page(s) could not be read; using the text from the other pages.")
+        return pages, backend
+    
+    @timed('ai.extract.docx')
     def extract_text_from_docx(self, docx_file):
         """Extract text from DOCX file"""
-        from docx import Document
-        
-        # Save the uploaded file to a temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.docx') as temp_file:
-            temp_file.write(docx_file.getbuffer())
-            temp_path = temp_file.name
+        document = UploadedDocument.from_upload(docx_file)
+        cached = self.cache.get(document, 'ai_resume_analyzer.docx', self.EXTRACTOR_VERSION)
+        if cached:
+            return cached['text']
         
         text = ""
         try:
-            doc = Document(temp_path)
-            for para in doc.paragraphs:
-                text += para.text + "\n"
+            text = "".join(line + "\n" for line in iter_docx_lines(document))
         except Exception as e:
             st.error(f"Error extracting text from DOCX: {e}")
         
-        os.unlink(temp_path)  # Clean up the temp file
+        self.cache.set(document, 'ai_resume_analyzer.docx', self.EXTRACTOR_VERSION, text, 'docx-xml')
         return text
     
+    @timed('llm.gemini')
     def analyze_resume_with_gemini(self, resume_text, job_description=None, job_role=None):
         """Analyze resume using Google Gemini AI"""
         if not resume_text:
@@ -290,6 +391,7 @@ class AIResumeAnalyzer:
         except Exception as e:
             return {"error": f"Analysis failed: {str(e)}"}
 
+    @timed('llm.openai_compatible')
     def analyze_resume_with_openai_compatible(self, resume_text, base_url, api_key, model_name, job_description=None, job_role=None):
         """Analyze resume using an OpenAI-compatible API"""
         if not resume_text:
@@ -495,7 +597,6 @@ class AIResumeAnalyzer:
             from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
             from reportlab.lib.units import inch
             import io
-            import re
 
             buffer = io.BytesIO()
             # Smaller margins for more content space
@@ -648,12 +749,12 @@ class AIResumeAnalyzer:
                     # Bullet
                     text = line.replace('- ', '').replace('* ', '').strip()
                     # Handle bold markdown
-                    text = re.sub(r'\*\*(.*?)\*\*', r'<b>\1</b>', text)
+                    text = patterns.MARKDOWN_BOLD.sub(r'<b>\1</b>', text)
                     content.append(Paragraph(f"• {text}", bullet_style))
                 else:
                     # Normal text
                     text = line
-                    text = re.sub(r'\*\*(.*?)\*\*', r'<b>\1</b>', text)
+                    text = patterns.MARKDOWN_BOLD.sub(r'<b>\1</b>', text)
                     
                     # Heuristic: If it looks like contact info (contains |, email, phone)
                     if i < 10 and ('|' in text or '@' in text or '+' in text):
@@ -709,25 +810,6 @@ class AIResumeAnalyzer:
                 st.info("Please make sure reportlab is installed: pip install reportlab")
                 return self.simple_generate_pdf_report(analysis_result, candidate_name, job_role)
             
-            # Helper function to clean markdown formatting
-            def clean_markdown(text):
-                if not text:
-                    return ""
-                
-                # Remove markdown formatting for bold and italic
-                text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)  # Remove ** for bold
-                text = re.sub(r'\*(.*?)\*', r'\1', text)      # Remove * for italic
-                text = re.sub(r'__(.*?)__', r'\1', text)      # Remove __ for bold
-                text = re.sub(r'_(.*?)_', r'\1', text)        # Remove _ for italic
-                
-                # Remove markdown formatting for headers
-                text = re.sub(r'^#{1,6}\s+', '', text, flags=re.MULTILINE)
-                
-                # Remove markdown formatting for links
-                text = re.sub(r'\[(.*?)\]\(.*?\)', r'\1', text)
-                
-                return text.strip()
-            
             # Validate input data
             if not analysis_result:
                 st.error("No analysis result provided for PDF generation")
@@ -1096,18 +1178,18 @@ class AIResumeAnalyzer:
                 
                 # If still 0, try to extract from the analysis text
                 if resume_score == 0 and "Resume Score:" in analysis_text:
-                    score_match = re.search(r'Resume Score:\s*(\d{1,3})/100', analysis_text)
+                    score_match = patterns.RESUME_SCORE_OUT_OF_100.search(analysis_text)
                     if score_match:
                         resume_score = int(score_match.group(1))
                     else:
                         # Try another pattern
-                        score_match = re.search(r'\bResume Score:\s*(\d{1,3})\b', analysis_text)
+                        score_match = patterns.RESUME_SCORE.search(analysis_text)
                         if score_match:
                             resume_score = int(score_match.group(1))
                         else:
                             # Try to find any number after "Resume Score:"
                             score_section = analysis_text.split("Resume Score:")[1].split("\n")[0].strip()
-                            score_match = re.search(r'\b(\d{1,3})\b', score_section)
+                            score_match = patterns.FIRST_NUMBER.search(score_section)
                             if score_match:
                                 resume_score = int(score_match.group(1))
 
@@ -1796,21 +1878,21 @@ class AIResumeAnalyzer:
             if "## Resume Score" in analysis_text:
                 score_section = analysis_text.split("## Resume Score")[1].strip()
                 # Extract the first number found
-                score_match = re.search(r'Resume Score:\s*(\d{1,3})/100', score_section)
+                score_match = patterns.RESUME_SCORE_OUT_OF_100.search(score_section)
                 if score_match:
                     score = int(score_match.group(1))
                     # Ensure score is within valid range
                     return max(0, min(score, 100))
                 
                 # Try another pattern if the first one doesn't match
-                score_match = re.search(r'\b(\d{1,3})\b', score_section)
+                score_match = patterns.FIRST_NUMBER.search(score_section)
                 if score_match:
                     score = int(score_match.group(1))
                     # Ensure score is within valid range
                     return max(0, min(score, 100))
             
             # If no score found in Resume Score section, try to find it elsewhere
-            score_match = re.search(r'Resume Score:\s*(\d{1,3})/100', analysis_text)
+            score_match = patterns.RESUME_SCORE_OUT_OF_100.search(analysis_text)
             if score_match:
                 score = int(score_match.group(1))
                 return max(0, min(score, 100))
@@ -1827,7 +1909,7 @@ class AIResumeAnalyzer:
             if "## ATS Optimization Assessment" in analysis_text:
                 ats_section = analysis_text.split("## ATS Optimization Assessment")[1].split("##")[0].strip()
                 # Extract the score using regex
-                score_match = re.search(r'ATS Score:\s*(\d{1,3})/100', ats_section)
+                score_match = patterns.ATS_SCORE_OUT_OF_100.search(ats_section)
                 if score_match:
                     score = int(score_match.group(1))
                     # Ensure score is within valid range
@@ -1842,7 +1924,7 @@ class AIResumeAnalyzer:
         Analyze a resume using the specified AI model
         
         Parameters:
-        - resume_text: The text content of the resume
+        - resume_text: The text content of the resume (a string or ResumeDocument)
         - job_role: The target job role
         - role_info: Additional information about the job role
         - model: The AI model to use ("Google Gemini" or "Anthropic Claude")
@@ -1850,6 +1932,16 @@ class AIResumeAnalyzer:
         Returns:
         - Dictionary containing analysis results
         """
+        resume_text = as_text(resume_text)
+        with collect_spans() as spans, span('ai.analyze'):
+            result = self._analyze_resume(resume_text, job_role, role_info, model)
+        
+        if TIMING_DEBUG:
+            result['timings'] = spans_to_timings(spans)
+        return result
+    
+    def _analyze_resume(self, resume_text, job_role, role_info, model):
+        """Run the selected model and parse its response into a structured result"""
         import traceback
         
         try:
@@ -1957,25 +2049,6 @@ class AIResumeAnalyzer:
                 st.info("Please make sure reportlab is installed: pip install reportlab")
                 return None
             
-            # Helper function to clean markdown formatting
-            def clean_markdown(text):
-                if not text:
-                    return ""
-                
-                # Remove markdown formatting for bold and italic
-                text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)  # Remove ** for bold
-                text = re.sub(r'\*(.*?)\*', r'\1', text)      # Remove * for italic
-                text = re.sub(r'__(.*?)__', r'\1', text)      # Remove __ for bold
-                text = re.sub(r'_(.*?)_', r'\1', text)        # Remove _ for italic
-                
-                # Remove markdown formatting for headers
-                text = re.sub(r'^#{1,6}\s+', '', text, flags=re.MULTILINE)
-                
-                # Remove markdown formatting for links
-                text = re.sub(r'\[(.*?)\]\(.*?\)', r'\1', text)
-                
-                return text.strip()
-            
             # Validate input data
             if not analysis_result:
                 st.error("No analysis result provided for PDF generation")
@@ -2200,18 +2273,18 @@ class AIResumeAnalyzer:
                 
                 # If still 0, try to extract from the analysis text
                 if resume_score == 0 and "Resume Score:" in analysis_text:
-                    score_match = re.search(r'Resume Score:\s*(\d{1,3})/100', analysis_text)
+                    score_match = patterns.RESUME_SCORE_OUT_OF_100.search(analysis_text)
                     if score_match:
                         resume_score = int(score_match.group(1))
                     else:
                         # Try another pattern
-                        score_match = re.search(r'\bResume Score:\s*(\d{1,3})\b', analysis_text)
+                        score_match = patterns.RESUME_SCORE.search(analysis_text)
                         if score_match:
                             resume_score = int(score_match.group(1))
                         else:
                             # Try to find any number after "Resume Score:"
                             score_section = analysis_text.split("Resume Score:")[1].split("\n")[0].strip()
-                            score_match = re.search(r'\b(\d{1,3})\b', score_section)
+                            score_match = patterns.FIRST_NUMBER.search(score_section)
                             if score_match:
                                 resume_score = int(score_match.group(1))
 
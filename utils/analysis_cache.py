@@ -0,0 +1,101 @@
+import hashlib
+import json
+import os
+import threading
+
+from .disk_cache import DiskCache
+from .resume_document import as_document
+
+# Where analysis results are kept, how much disk they may use and for how long
+ANALYSIS_CACHE_DIR = os.getenv(
+    "ANALYSIS_CACHE_DIR", os.path.join(".cache", "analysis")
+)
+ANALYSIS_CACHE_MAX_BYTES = int(
+    os.getenv("ANALYSIS_CACHE_MAX_BYTES", str(64 * 1024 * 1024))
+)
+ANALYSIS_CACHE_TTL_SECONDS = int(
+    os.getenv("ANALYSIS_CACHE_TTL_SECONDS", str(7 * 24 * 60 * 60))
+)
+ANALYSIS_CACHE_ENABLED = os.getenv("ANALYSIS_CACHE_ENABLED", "1") != "0"
+
+# Marker file recording which analyzer version produced the entries in a directory
+_VERSION_MARKER = '.analyzer-version'
+
+
+def requirements_digest(job_requirements):
+    """Hash the job requirements independently of dict ordering"""
+    encoded = json.dumps(job_requirements or {}, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def analysis_key(text, job_requirements, version):
+    """Build the cache key for analyzing text against job_requirements"""
+    document = as_document(text)
+    return hashlib.sha256(
+        f"{version}:{document.sha256}:{requirements_digest(job_requirements)}".encode('utf-8')
+    ).hexdigest()
+
+
+class AnalysisCache:
+    """Cache of ResumeAnalyzer.analyze_resume results shared across sessions"""
+
+    def __init__(self, version, directory=ANALYSIS_CACHE_DIR,
+                 max_bytes=ANALYSIS_CACHE_MAX_BYTES, ttl=ANALYSIS_CACHE_TTL_SECONDS):
+        self.version = str(version)
+        self.store = DiskCache(directory, max_bytes=max_bytes, ttl=ttl)
+        self._check_version()
+
+    def _check_version(self):
+        """Drop every entry written by another analyzer version"""
+        marker = os.path.join(self.store.directory, _VERSION_MARKER)
+        try:
+            with open(marker, encoding='utf-8') as f:
+                current = f.read().strip()
+        except OSError:
+            current = None
+        if current == self.version:
+            return
+        self.store.clear()
+        with open(marker, 'w', encoding='utf-8') as f:
+            f.write(self.version)
+
+    def get(self, text, job_requirements):
+        """Return the cached analysis of text for these requirements, or None"""
+        return self.store.get(analysis_key(text, job_requirements, self.version))
+
+    def set(self, text, job_requirements, analysis):
+        """Remember an analysis; failed analyses are not cached"""
+        if not analysis or 'error' in analysis:
+            return
+        self.store.set(analysis_key(text, job_requirements, self.version), analysis)
+
+
+class _NullAnalysisCache:
+    def get(self, text, job_requirements):
+        return None
+
+    def set(self, text, job_requirements, analysis):
+        pass
+
+
+_caches = {}
+_cache_lock = threading.Lock()
+
+
+def get_analysis_cache(version):
+    """Return the process-wide analysis cache for one analyzer version"""
+    cache = _caches.get(version)
+    if cache is None:
+        with _cache_lock:
+            cache = _caches.get(version)
+            if cache is None:
+                if not ANALYSIS_CACHE_ENABLED:
+                    cache = _NullAnalysisCache()
+                else:
+                    try:
+                        cache = AnalysisCache(version)
+                    except OSError as e:
+                        print(f"Analysis cache disabled: {e}")
+                        cache = _NullAnalysisCache()
+                _caches[version] = cache
+    return cache
@@ -0,0 +1,169 @@
+"""
+Batch resume analysis.
+
+Runs ResumeAnalyzer.analyze_resume over many resumes in a process pool. Input is
+consumed lazily in chunks, only a bounded number of chunks are in flight, and results
+are streamed back as (index, analysis) pairs either in input order or as soon as they
+complete. A failing resume yields an error analysis instead of stopping the batch.
+"""
+
+import multiprocessing
+import os
+import traceback
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+
+from .resume_document import ResumeDocument
+
+BATCH_WORKERS = int(os.getenv("BATCH_WORKERS", str(os.cpu_count() or 1)))
+BATCH_CHUNKSIZE = int(os.getenv("BATCH_CHUNKSIZE", "8"))
+
+_worker_analyzer = None
+
+
+def _get_worker_analyzer():
+    global _worker_analyzer
+    if _worker_analyzer is None:
+        from .resume_analyzer import ResumeAnalyzer
+        _worker_analyzer = ResumeAnalyzer()
+    return _worker_analyzer
+
+
+def error_analysis(message):
+    """Analysis result used for a resume that could not be analyzed"""
+    return {
+        'error': f"Resume analysis failed: {message}",
+        'ats_score': 0,
+        'document_type': 'unknown',
+        'keyword_match': {'score': 0, 'found_skills': [], 'missing_skills': []},
+        'section_score': 0,
+        'format_score': 0,
+        'suggestions': [f"Error analyzing resume: {message}. Please check your file and try again."]
+    }
+
+
+def _analyze_chunk(chunk, job_requirements):
+    """Worker entry point: analyze a list of (index, resume) pairs"""
+    analyzer = _get_worker_analyzer()
+    results = []
+    for index, resume in chunk:
+        try:
+            resume_data = {'raw_text': resume} if isinstance(resume, (str, ResumeDocument)) else resume
+            results.append((index, analyzer.analyze_resume(resume_data, job_requirements)))
+        except Exception as e:
+            print(f"Error analyzing resume {index}: {e}")
+            print(traceback.format_exc())
+            results.append((index, error_analysis(str(e))))
+    return results
+
+
+def _chunks(resumes, chunksize):
+    iterator = enumerate(resumes)
+    while True:
+        chunk = list(islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _new_pool(workers):
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+def analyze_many(resumes, job_requirements, workers=BATCH_WORKERS, chunksize=BATCH_CHUNKSIZE, ordered=True):
+    """
+    Analyze many resumes and yield (index, analysis) pairs.
+
+    resumes is any iterable of resume_data dicts, raw text strings or ResumeDocuments.
+    With ordered=True results come back in input order; otherwise each chunk is yielded
+    as soon as it finishes. workers <= 1 analyzes in the calling process.
+
+    A resume that kills its worker process breaks the whole pool, so the pool is
+    replaced and the chunks that were in flight are re-run one at a time; the chunk
+    that crashes again is retried item by item and only the crashing resume gets an
+    error analysis.
+    """
+    chunks = _chunks(resumes, max(1, chunksize))
+
+    if workers <= 1:
+        for chunk in chunks:
+            yield from _analyze_chunk(chunk, job_requirements)
+        return
+
+    max_in_flight = workers * 2
+    pool = _new_pool(workers)
+    pending = {}  # future -> (chunk, whether it runs alone in the pool)
+    suspects = deque()  # Chunks that were in flight when a worker died
+    ready = {}
+    next_index = 0
+    exhausted = False
+
+    try:
+        while True:
+            broken = False
+            if suspects:
+                # Run suspects alone so a repeated crash can be pinned on one chunk, then one item
+                if not pending:
+                    chunk = suspects.popleft()
+                    try:
+                        pending[pool.submit(_analyze_chunk, chunk, job_requirements)] = (chunk, True)
+                    except BrokenProcessPool:
+                        suspects.appendleft(chunk)
+                        broken = True
+            else:
+                # Keep the pool busy without reading the whole input up front
+                while not exhausted and len(pending) < max_in_flight:
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        exhausted = True
+                        break
+                    try:
+                        pending[pool.submit(_analyze_chunk, chunk, job_requirements)] = (chunk, False)
+                    except BrokenProcessPool:
+                        # The pool broke since the last wait; retry this chunk with the others
+                        suspects.append(chunk)
+                        broken = True
+                        break
+
+            results = []
+            if pending and not broken:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunk, alone = pending.pop(future)
+                    try:
+                        results.extend(future.result())
+                    except BrokenProcessPool as e:
+                        broken = True
+                        if not alone:
+                            suspects.append(chunk)
+                        elif len(chunk) > 1:
+                            # This chunk crashed on its own; find the resume that did it
+                            suspects.extendleft([item] for item in reversed(chunk))
+                        else:
+                            print(f"Resume {chunk[0][0]} crashed its worker process: {e}")
+                            results.append((chunk[0][0], error_analysis("the analysis worker process crashed")))
+                    except Exception as e:
+                        # Not a crash (e.g. an unpicklable result); fail only this chunk
+                        results.extend((index, error_analysis(str(e))) for index, _ in chunk)
+
+            if broken:
+                # Every other in-flight chunk fails with the pool, through no fault of its own
+                suspects.extend(chunk for chunk, _ in pending.values())
+                pending.clear()
+                pool.shutdown(wait=False, cancel_futures=True)
+                pool = _new_pool(workers)
+
+            if not ordered:
+                yield from results
+            else:
+                ready.update(results)
+                while next_index in ready:
+                    yield next_index, ready.pop(next_index)
+                    next_index += 1
+
+            if exhausted and not pending and not suspects:
+                break
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,148 @@
+import json
+import os
+import tempfile
+import threading
+import time
+
+
+class DiskCache:
+    """Size-bounded least-recently-used cache that stores one file per entry on disk.
+
+    Entries are shared by every process pointing at the same directory. Recency is
+    tracked through the file access time, which is set explicitly on every hit, so
+    eviction simply removes the least recently used files until the directory fits in
+    ``max_bytes``. The modification time records when an entry was written; with a
+    ``ttl`` (seconds) entries older than that are treated as misses and removed.
+    """
+
+    def __init__(self, directory, max_bytes=128 * 1024 * 1024, ttl=None):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._size = None
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key)
+
+    def get_bytes(self, key):
+        """Return the raw payload stored under key, or None on a miss"""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                written = os.fstat(f.fileno()).st_mtime
+                if self.ttl is not None and time.time() - written > self.ttl:
+                    data = None
+                else:
+                    data = f.read()
+        except OSError:
+            return None
+        if data is None:
+            self.delete(key)
+            return None
+        try:
+            os.utime(path, (time.time(), written))  # Mark as recently used
+        except OSError:
+            pass
+        return data
+
+    def set_bytes(self, key, data):
+        """Store a raw payload under key and evict old entries if needed"""
+        if len(data) > self.max_bytes:
+            return
+        path = self._path(key)
+        try:
+            previous = os.path.getsize(path)
+        except OSError:
+            previous = 0
+        # Write to a temporary file first so readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Error writing cache entry: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += len(data) - previous
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def get(self, key):
+        """Return the JSON value stored under key, or None on a miss"""
+        data = self.get_bytes(key)
+        if data is None:
+            return None
+        try:
+            return json.loads(data.decode('utf-8'))
+        except ValueError:
+            return None
+
+    def set(self, key, value):
+        """Store a JSON-serializable value under key"""
+        self.set_bytes(key, json.dumps(value).encode('utf-8'))
+
+    def delete(self, key):
+        try:
+            os.unlink(self._path(key))
+        except OSError:
+            pass
+        with self._lock:
+            self._size = None
+
+    def clear(self):
+        """Remove every entry from the cache"""
+        for _, path, _ in self._entries():
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+        with self._lock:
+            self._size = 0
+
+    def _entries(self):
+        entries = []
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return entries
+        for name in names:
+            if name.startswith('.'):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_atime, path, stat.st_size))
+        return entries
+
+    def _scan_size(self):
+        return sum(size for _, _, size in self._entries())
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits its budget"""
+        entries = sorted(self._entries())
+        total = sum(size for _, _, size in entries)
+        for _, path, size in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+                total -= size
+            except OSError:
+                continue
+        self._size = total
+
+    def __len__(self):
+        return len(self._entries())
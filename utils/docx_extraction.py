@@ -0,0 +1,112 @@
+"""
+Streaming DOCX text extraction.
+
+Reads the WordprocessingML parts straight out of the zip with an incremental XML
+parser instead of building python-docx's object model. Besides body paragraphs it
+also emits table rows, text boxes, headers and footers, where many resume templates
+keep contact details and skills.
+"""
+
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+
+from .upload import open_stream
+
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_MC = '{http://schemas.openxmlformats.org/markup-compatibility/2006}'
+
+P = _W + 'p'
+R = _W + 'r'
+T = _W + 't'
+TAB = _W + 'tab'
+BR = _W + 'br'
+CR = _W + 'cr'
+TR = _W + 'tr'
+TC = _W + 'tc'
+MC_FALLBACK = _MC + 'Fallback'
+
+_HEADER_PART = re.compile(r'^word/header\d*\.xml$')
+_FOOTER_PART = re.compile(r'^word/footer\d*\.xml$')
+
+
+def _part_names(names):
+    """Headers first, then the body, then footers"""
+    headers = sorted(name for name in names if _HEADER_PART.match(name))
+    footers = sorted(name for name in names if _FOOTER_PART.match(name))
+    return headers + ['word/document.xml'] + footers
+
+
+def _iter_part_lines(stream):
+    """Yield paragraph and table-row text from one WordprocessingML part in reading order"""
+    paragraphs = []  # Runs of the paragraphs being read (text box paragraphs nest)
+    cells = []       # Paragraphs of the table cells being read (tables can nest)
+    rows = []        # Cells of the table rows being read
+    runs = 0         # Depth inside w:r; w:tab outside runs is a tab stop definition
+    skip = 0         # Depth inside mc:Fallback, which duplicates the mc:Choice content
+
+    for event, elem in ET.iterparse(stream, events=('start', 'end')):
+        tag = elem.tag
+        if tag == MC_FALLBACK:
+            if event == 'start':
+                skip += 1
+            else:
+                skip -= 1
+                elem.clear()
+            continue
+        if skip:
+            continue
+
+        if event == 'start':
+            if tag == P:
+                paragraphs.append([])
+            elif tag == R:
+                runs += 1
+            elif tag == TC:
+                cells.append([])
+            elif tag == TR:
+                rows.append([])
+            continue
+
+        if tag == R:
+            runs -= 1
+        elif runs and paragraphs and tag == T:
+            paragraphs[-1].append(elem.text or '')
+        elif runs and paragraphs and tag == TAB:
+            paragraphs[-1].append('\t')
+        elif runs and paragraphs and tag in (BR, CR):
+            paragraphs[-1].append('\n')
+        elif tag == P:
+            text = ''.join(paragraphs.pop())
+            elem.clear()
+            if cells:
+                cells[-1].append(text)
+            else:
+                yield text
+        elif tag == TC:
+            cell = ' '.join(text.strip() for text in cells.pop() if text.strip())
+            if rows:
+                rows[-1].append(cell)
+        elif tag == TR:
+            row = ' | '.join(cell for cell in rows.pop() if cell)
+            elem.clear()
+            if cells:
+                cells[-1].append(row)
+            else:
+                yield row
+
+
+def iter_docx_lines(source):
+    """Yield the text of every paragraph and table row of a DOCX file in reading order"""
+    with zipfile.ZipFile(open_stream(source)) as archive:
+        names = set(archive.namelist())
+        for name in _part_names(names):
+            if name not in names:
+                continue
+            with archive.open(name) as part:
+                yield from _iter_part_lines(part)
+
+
+def extract_docx_text(source):
+    """Extract the text of a DOCX file given as bytes or an UploadedDocument"""
+    return '\n'.join(iter_docx_lines(source))
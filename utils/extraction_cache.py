@@ -0,0 +1,76 @@
+import hashlib
+import os
+import threading
+
+from .disk_cache import DiskCache
+from .upload import UploadedDocument
+
+# Where extracted text is kept and how much disk it may use
+EXTRACTION_CACHE_DIR = os.getenv(
+    "EXTRACTION_CACHE_DIR", os.path.join(".cache", "extraction")
+)
+EXTRACTION_CACHE_MAX_BYTES = int(
+    os.getenv("EXTRACTION_CACHE_MAX_BYTES", str(128 * 1024 * 1024))
+)
+EXTRACTION_CACHE_ENABLED = os.getenv("EXTRACTION_CACHE_ENABLED", "1") != "0"
+
+
+def extraction_key(data, extractor, version):
+    """Build a content-addressed cache key for one extractor version"""
+    if isinstance(data, UploadedDocument):
+        content_digest = data.sha256
+    else:
+        content_digest = hashlib.sha256(data).hexdigest()
+    return hashlib.sha256(f"{extractor}:{version}:{content_digest}".encode('utf-8')).hexdigest()
+
+
+class ExtractionCache:
+    """Cache of extracted document text keyed by file content and extractor version"""
+
+    def __init__(self, directory=EXTRACTION_CACHE_DIR, max_bytes=EXTRACTION_CACHE_MAX_BYTES):
+        self.store = DiskCache(directory, max_bytes=max_bytes)
+
+    def get(self, data, extractor, version):
+        """Return {'text': ..., 'backend': ...} for a previously extracted file, or None"""
+        entry = self.store.get(extraction_key(data, extractor, version))
+        if not entry or 'text' not in entry:
+            return None
+        return entry
+
+    def set(self, data, extractor, version, text, backend):
+        """Remember the text extracted from data; empty results are not cached"""
+        if not text or not text.strip():
+            return
+        self.store.set(
+            extraction_key(data, extractor, version),
+            {'text': text, 'backend': backend},
+        )
+
+
+class _NullExtractionCache:
+    def get(self, data, extractor, version):
+        return None
+
+    def set(self, data, extractor, version, text, backend):
+        pass
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_extraction_cache():
+    """Return the process-wide extraction cache"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                if not EXTRACTION_CACHE_ENABLED:
+                    _cache = _NullExtractionCache()
+                else:
+                    try:
+                        _cache = ExtractionCache()
+                    except OSError as e:
+                        print(f"Extraction cache disabled: {e}")
+                        _cache = _NullExtractionCache()
+    return _cache
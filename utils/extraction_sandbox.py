@@ -0,0 +1,250 @@
+"""
+Supervised, budget-limited PDF extraction.
+
+A pathological upload (huge embedded images, deeply nested content streams) can pin
+a parser indefinitely. Sandboxed extraction runs the parser in a dedicated child
+process with a wall-clock timeout, an address-space cap and a maximum page count.
+Pages are streamed back to the parent as they are extracted, so when a budget is
+exceeded the caller still gets the partial text plus a structured reason.
+"""
+
+import multiprocessing
+import os
+import time
+
+from .pdf_extraction import count_pages, _BACKENDS
+from .upload import UploadedDocument
+
+EXTRACTION_SANDBOX = os.getenv("EXTRACTION_SANDBOX", "1") != "0"
+EXTRACTION_TIMEOUT_SECONDS = float(os.getenv("EXTRACTION_TIMEOUT_SECONDS", "60"))
+EXTRACTION_MEMORY_LIMIT_MB = int(os.getenv("EXTRACTION_MEMORY_LIMIT_MB", "1024"))
+EXTRACTION_MAX_PAGES = int(os.getenv("EXTRACTION_MAX_PAGES", "50"))
+
+BUDGET_MESSAGES = {
+    'timeout': "Text extraction took longer than {limit:g} seconds",
+    'memory': "Text extraction needed more than {limit} MB of memory",
+    'page_limit': "Only the first {limit} pages were read",
+    'crashed': "The PDF parser stopped unexpectedly",
+}
+
+
+def _address_space_bytes():
+    """Virtual memory size of this process, or None where /proc is not available"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[0]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _apply_memory_limit(limit_mb):
+    """
+    Let the process grow by at most limit_mb.
+
+    The child starts with whatever the forkserver (or spawn bootstrap) already mapped,
+    which for this package is hundreds of MB, so the cap is set relative to the
+    current address space size rather than as an absolute value.
+    """
+    try:
+        import resource
+    except ImportError:  # Not available on Windows
+        return
+    limit = limit_mb * 1024 * 1024 + (_address_space_bytes() or 0)
+    try:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    except (ValueError, OSError):
+        pass
+
+
+def _import_backend(backend):
+    """Import the parser up front so its modules are not charged to the memory budget"""
+    try:
+        __import__(backend)
+    except ImportError:
+        pass
+
+
+def _sandbox_main(conn, file_content, backend, max_pages, memory_limit_mb):
+    """Child process entry point: stream ('page', text) messages, then a final status"""
+    outcome = None
+    try:
+        if memory_limit_mb:
+            _import_backend(backend)
+            _apply_memory_limit(memory_limit_mb)
+        page_count = count_pages(file_content)
+        conn.send(('page_count', page_count))
+        stop = min(page_count, max_pages) if max_pages else None
+        for page_text, _ in _BACKENDS[backend](file_content, 0, stop):
+            conn.send(('page', page_text))
+        if max_pages and page_count > max_pages:
+            outcome = ('budget', 'page_limit')
+        else:
+            outcome = ('done', None)
+    except MemoryError:
+        # Reported after the handler so the parser's frames (and memory) are released first
+        outcome = ('budget', 'memory')
+    except Exception as e:
+        outcome = ('error', str(e))
+    try:
+        conn.send(outcome)
+    finally:
+        conn.close()
+
+
+def _call_main(conn, func, args, memory_limit_mb):
+    """Child process entry point for sandboxed_call: send ('result', value) or a failure"""
+    outcome = None
+    try:
+        if memory_limit_mb:
+            _import_backend('pypdf')
+            _apply_memory_limit(memory_limit_mb)
+        outcome = ('result', func(*args))
+    except MemoryError:
+        outcome = ('budget', 'memory')
+    except Exception as e:
+        outcome = ('error', str(e))
+    try:
+        conn.send(outcome)
+    finally:
+        conn.close()
+
+
+def _context():
+    if 'forkserver' not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('spawn')
+    # forkserver children are cheap to start and safe from a threaded server; preloading
+    # this module and the parsers means each child starts with them already imported
+    ctx = multiprocessing.get_context('forkserver')
+    ctx.set_forkserver_preload([__name__, 'pypdf', 'pdfplumber'])
+    return ctx
+
+
+def budget_exceeded(reason, limit=None):
+    """Build the structured report describing why extraction stopped early"""
+    message = BUDGET_MESSAGES.get(reason, reason)
+    return {'reason': reason, 'limit': limit, 'message': message.format(limit=limit)}
+
+
+class ExtractionBudgetExceeded(Exception):
+    """Raised by sandboxed_call when the child runs out of time or memory"""
+
+    def __init__(self, budget):
+        super().__init__(budget['message'])
+        self.budget = budget
+
+
+def _stop(process):
+    if process.is_alive():
+        process.terminate()
+        process.join(1)
+        if process.is_alive():
+            process.kill()
+    process.join()
+
+
+def sandboxed_call(func, *args, timeout=EXTRACTION_TIMEOUT_SECONDS, memory_limit_mb=EXTRACTION_MEMORY_LIMIT_MB):
+    """
+    Run func(*args) in a supervised child process and return its result.
+
+    For whole-document PDF helpers (triage, page resource checks) that have no pages to
+    stream. func must be a module-level function and UploadedDocument arguments are
+    sent as bytes. Raises ExtractionBudgetExceeded on a timeout, memory or crash
+    outcome and Exception with the child's message when func raised.
+    """
+    args = tuple(arg.tobytes() if isinstance(arg, UploadedDocument) else arg for arg in args)
+    ctx = _context()
+    parent_conn, child_conn = ctx.Pipe(duplex=False)
+    process = ctx.Process(target=_call_main, args=(child_conn, func, args, memory_limit_mb), daemon=True)
+    process.start()
+    child_conn.close()
+
+    try:
+        if not parent_conn.poll(timeout):
+            raise ExtractionBudgetExceeded(budget_exceeded('timeout', timeout))
+        try:
+            kind, value = parent_conn.recv()
+        except EOFError:
+            process.join(1)
+            if memory_limit_mb and process.exitcode is not None and process.exitcode < 0:
+                raise ExtractionBudgetExceeded(budget_exceeded('memory', memory_limit_mb))
+            raise ExtractionBudgetExceeded(budget_exceeded('crashed'))
+    finally:
+        parent_conn.close()
+        _stop(process)
+
+    if kind == 'budget':
+        raise ExtractionBudgetExceeded(budget_exceeded(value, memory_limit_mb))
+    if kind == 'error':
+        raise Exception(value)
+    return value
+
+
+class SandboxedPdfExtraction:
+    """
+    Iterate over the pages of a PDF extracted in a supervised child process.
+
+    After iteration, budget_exceeded is None when the whole document was read, or a
+    dict with 'reason' ('timeout', 'memory', 'page_limit' or 'crashed'), 'limit' and
+    a user-facing 'message'. page_count holds the total number of pages when known.
+    """
+
+    def __init__(self, file_content, backend='pypdf', timeout=EXTRACTION_TIMEOUT_SECONDS,
+                 memory_limit_mb=EXTRACTION_MEMORY_LIMIT_MB, max_pages=EXTRACTION_MAX_PAGES):
+        if isinstance(file_content, UploadedDocument):
+            file_content = file_content.tobytes()  # Memoryviews cannot be pickled to the child
+        self.file_content = file_content
+        self.backend = backend
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.max_pages = max_pages
+        self.budget_exceeded = None
+        self.page_count = None
+
+    def __iter__(self):
+        ctx = _context()
+        parent_conn, child_conn = ctx.Pipe(duplex=False)
+        process = ctx.Process(
+            target=_sandbox_main,
+            args=(child_conn, self.file_content, self.backend, self.max_pages, self.memory_limit_mb),
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        deadline = time.monotonic() + self.timeout
+
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not parent_conn.poll(remaining):
+                    self.budget_exceeded = budget_exceeded('timeout', self.timeout)
+                    return
+                try:
+                    kind, value = parent_conn.recv()
+                except EOFError:
+                    # The child died without reporting. Under an address-space cap a
+                    # signal death is an allocation failure inside a C extension
+                    process.join(1)
+                    if self.memory_limit_mb and process.exitcode is not None and process.exitcode < 0:
+                        self.budget_exceeded = budget_exceeded('memory', self.memory_limit_mb)
+                    else:
+                        self.budget_exceeded = budget_exceeded('crashed')
+                    return
+
+                if kind == 'page':
+                    yield value
+                elif kind == 'page_count':
+                    self.page_count = value
+                elif kind == 'budget':
+                    limit = self.max_pages if value == 'page_limit' else self.memory_limit_mb
+                    self.budget_exceeded = budget_exceeded(value, limit)
+                    return
+                elif kind == 'error':
+                    raise Exception(value)
+                else:
+                    return
+        finally:
+            parent_conn.close()
+            _stop(process)
@@ -0,0 +1,108 @@
+"""
+Compiled multi-pattern keyword matching.
+
+KeywordMatcher builds an Aho-Corasick automaton over a keyword set once and then
+finds every keyword occurrence in a single pass over the text, so the cost of a scan
+no longer grows with the number of keywords.
+"""
+
+from collections import deque
+from functools import lru_cache
+
+from .resume_document import ResumeDocument
+
+
+def _is_word_char(ch):
+    return ch.isalnum() or ch == '_'
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick matcher over a fixed set of keywords (case-insensitive).
+
+    With word_boundary=True a match only counts when it is not glued to a word
+    character on either side, so "java" does not match inside "javascript". Edges of
+    keywords that are not word characters ("c++", ".net") are not constrained.
+    """
+
+    def __init__(self, keywords, word_boundary=True):
+        self.keywords = list(keywords)
+        self.word_boundary = word_boundary
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+
+        for index, keyword in enumerate(self.keywords):
+            pattern = keyword.lower()
+            if not pattern:
+                continue
+            state = 0
+            for ch in pattern:
+                next_state = self._goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][ch] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append((index, len(pattern)))
+
+        # Breadth-first pass to link each state to its longest proper suffix state
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(ch, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def iter_matches(self, text):
+        """Yield (start, end, keyword) for every keyword occurrence in the lowercased text"""
+        goto, fail, output = self._goto, self._fail, self._output
+        # A ResumeDocument already holds its lowercased text
+        text_lower = text.lower if isinstance(text, ResumeDocument) else text.lower()
+        state = 0
+        for position, ch in enumerate(text_lower):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not output[state]:
+                continue
+            end = position + 1
+            for index, length in output[state]:
+                start = end - length
+                if self.word_boundary and not self._at_boundary(text_lower, start, end):
+                    continue
+                yield start, end, self.keywords[index]
+
+    def _at_boundary(self, text, start, end):
+        if start > 0 and _is_word_char(text[start]) and _is_word_char(text[start - 1]):
+            return False
+        if end < len(text) and _is_word_char(text[end - 1]) and _is_word_char(text[end]):
+            return False
+        return True
+
+    def find_all(self, text):
+        """Return a dict mapping each keyword found in text to its start positions"""
+        positions = {}
+        for start, _, keyword in self.iter_matches(text):
+            positions.setdefault(keyword, []).append(start)
+        return positions
+
+    def found(self, text):
+        """Return the set of keywords that occur in text"""
+        return {keyword for _, _, keyword in self.iter_matches(text)}
+
+
+@lru_cache(maxsize=256)
+def _cached_matcher(keywords, word_boundary):
+    return KeywordMatcher(keywords, word_boundary=word_boundary)
+
+
+def get_matcher(keywords, word_boundary=True):
+    """Return a compiled matcher for a keyword set, built once and reused"""
+    return _cached_matcher(tuple(keywords), word_boundary)
@@ -0,0 +1,181 @@
+"""
+Page-level OCR helpers.
+
+Only pages whose text layer is missing or too sparse, and which look scanned (no
+fonts, or an embedded image; see utils.pdf_triage.scanned_pages), are rasterized and
+OCR'd, so a typed resume with one scanned certificate page pays for a single page of
+OCR and a short typed last page is left alone.
+"""
+
+import os
+import tempfile
+import time
+
+# Pages with fewer non-whitespace characters than this are treated as image-only
+OCR_MIN_PAGE_CHARS = int(os.getenv("OCR_MIN_PAGE_CHARS", "40"))
+# Rasterization settings; one page at this resolution is the peak image memory of an OCR job
+OCR_DPI = int(os.getenv("OCR_DPI", "200"))
+OCR_GRAYSCALE = os.getenv("OCR_GRAYSCALE", "1") != "0"
+# Submit all pages of a document to a single Tesseract process instead of one per page
+OCR_BATCH = os.getenv("OCR_BATCH", "1") != "0"
+
+
+def text_density(page_text):
+    """Number of non-whitespace characters in a page's extracted text"""
+    if not page_text:
+        return 0
+    return sum(1 for ch in page_text if not ch.isspace())
+
+
+def _remaining(deadline):
+    """Seconds left before deadline (a time.monotonic() value), or None without one"""
+    if deadline is None:
+        return None
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise TimeoutError("OCR deadline exceeded")
+    return remaining
+
+
+def pages_needing_ocr(pages, min_chars=OCR_MIN_PAGE_CHARS):
+    """Return the zero-based indices of pages whose text layer is missing or too sparse"""
+    return [i for i, page_text in enumerate(pages) if text_density(page_text) < min_chars]
+
+
+def iter_page_images(pdf_path, page_indices, dpi=OCR_DPI, grayscale=OCR_GRAYSCALE, poppler_path=None, deadline=None):
+    """
+    Rasterize the given zero-based pages one at a time, yielding (index, image).
+
+    Each page is rendered with its own first_page/last_page window, so only one page
+    image is alive at a time. The image is closed once the consumer moves on.
+    """
+    from pdf2image import convert_from_path
+
+    for index in page_indices:
+        page_number = index + 1  # pdf2image pages are one-based
+        kwargs = {
+            'dpi': dpi,
+            'grayscale': grayscale,
+            'first_page': page_number,
+            'last_page': page_number,
+            'thread_count': 1,
+        }
+        if poppler_path:
+            kwargs['poppler_path'] = poppler_path
+        timeout = _remaining(deadline)
+        if timeout is not None:
+            kwargs['timeout'] = timeout
+        images = convert_from_path(pdf_path, **kwargs)
+        try:
+            for image in images:
+                yield index, image
+        finally:
+            for image in images:
+                image.close()
+            del images
+
+
+def render_page_files(pdf_path, page_indices, output_folder, dpi=OCR_DPI, grayscale=OCR_GRAYSCALE, poppler_path=None,
+                      deadline=None):
+    """
+    Render the given zero-based pages to image files, one page at a time.
+
+    Only file paths are returned, so no page image is held in memory. Returns a list of
+    (index, path) tuples in page order.
+    """
+    from pdf2image import convert_from_path
+
+    rendered = []
+    for index in page_indices:
+        page_number = index + 1  # pdf2image pages are one-based
+        kwargs = {
+            'dpi': dpi,
+            'grayscale': grayscale,
+            'first_page': page_number,
+            'last_page': page_number,
+            'output_folder': output_folder,
+            'output_file': f"page-{index:05d}",
+            'paths_only': True,
+            'fmt': 'png',
+            'thread_count': 1,
+        }
+        if poppler_path:
+            kwargs['poppler_path'] = poppler_path
+        timeout = _remaining(deadline)
+        if timeout is not None:
+            kwargs['timeout'] = timeout
+        rendered.extend((index, path) for path in convert_from_path(pdf_path, **kwargs))
+    return rendered
+
+
+def _split_batch_output(output, expected):
+    """Split multi-image Tesseract output on its form-feed page separator"""
+    texts = output.split("\f")
+    while len(texts) > expected and not texts[-1].strip():
+        texts.pop()
+    return texts if len(texts) == expected else None
+
+
+def _image_to_string(image, deadline):
+    import pytesseract
+
+    # pytesseract treats a timeout of 0 as no limit
+    return pytesseract.image_to_string(image, timeout=_remaining(deadline) or 0)
+
+
+def _ocr_pages_batched(pdf_path, page_indices, poppler_path, dpi, grayscale, deadline):
+    """OCR every requested page with a single Tesseract process fed an image list file"""
+    results = {}
+    with tempfile.TemporaryDirectory(prefix='ocr-') as folder:
+        rendered = render_page_files(pdf_path, page_indices, folder, dpi, grayscale, poppler_path, deadline)
+        if not rendered:
+            return results
+
+        # Tesseract treats a text file input as a list of images and emits one page each
+        list_path = os.path.join(folder, 'pages.txt')
+        with open(list_path, 'w', encoding='utf-8') as f:
+            f.write("\n".join(path for _, path in rendered) + "\n")
+        texts = _split_batch_output(_image_to_string(list_path, deadline), len(rendered))
+        if texts is None:
+            # Page boundaries could not be recovered; OCR the rendered files individually
+            texts = [_image_to_string(path, deadline) for _, path in rendered]
+
+        for (index, _), page_text in zip(rendered, texts):
+            results[index] = results[index] + "\n" + page_text if index in results else page_text
+    return results
+
+
+def ocr_pages(pdf_path, page_indices, poppler_path=None, dpi=OCR_DPI, grayscale=OCR_GRAYSCALE, timeout=None):
+    """
+    Rasterize and OCR only the given zero-based pages of a PDF.
+
+    Multi-page requests are rendered to disk page by page and OCR'd in one Tesseract
+    invocation; single pages are rendered and OCR'd in memory. Returns a dict mapping
+    page index to OCR text. With a timeout (seconds) the Poppler and Tesseract
+    subprocesses share one deadline and TimeoutError is raised once it passes.
+    """
+    page_indices = list(page_indices)
+    deadline = time.monotonic() + timeout if timeout else None
+    try:
+        if OCR_BATCH and len(page_indices) > 1:
+            return _ocr_pages_batched(pdf_path, page_indices, poppler_path, dpi, grayscale, deadline)
+
+        results = {}
+        for index, image in iter_page_images(pdf_path, page_indices, dpi, grayscale, poppler_path, deadline):
+            page_text = _image_to_string(image, deadline)
+            results[index] = results[index] + "\n" + page_text if index in results else page_text
+        return results
+    except Exception as e:
+        # Poppler and pytesseract report their own timeouts with library-specific errors
+        if deadline is not None and time.monotonic() >= deadline and not isinstance(e, TimeoutError):
+            raise TimeoutError(f"OCR took longer than {timeout:g} seconds") from e
+        raise
+
+
+def merge_ocr_pages(pages, ocr_results):
+    """Replace sparse text-layer pages with OCR output when OCR recovered more text"""
+    merged = list(pages)
+    for index, ocr_text in ocr_results.items():
+        if text_density(ocr_text) > text_density(merged[index]):
+            merged[index] = ocr_text
+    return merged
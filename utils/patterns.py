@@ -0,0 +1,140 @@
+"""
+Precompiled regular expressions shared by the analyzers.
+
+Every pattern is compiled once at import time instead of being looked up in re's
+small internal cache on each call, which thrashes once more distinct patterns are in
+use than the cache holds. PATTERNS names them all for benchmark_patterns().
+"""
+
+import re
+import time
+
+# Contact details -------------------------------------------------------------
+
+EMAIL = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+PHONE = re.compile(r'(?:\+\d{1,3}[-.]?\s*)?\(?\d{3}\)?[-.]?\s*\d{3}[-.]?\s*\d{4}')
+LINKEDIN = re.compile(r'linkedin\.com/in/[\w-]+')
+GITHUB = re.compile(r'github\.com/[\w-]+')
+# Personal sites: an explicit URL that is not LinkedIn/GitHub, or a common static host
+PORTFOLIO = re.compile(
+    r'(?:https?://|www\.)(?!(?:www\.)?(?:linkedin|github)\.com)[\w-]+(?:\.[\w-]+)*\.[A-Za-z]{2,}(?:/[\w./%-]*)?'
+    r'|[\w-]+\.(?:github\.io|netlify\.app|vercel\.app|pages\.dev)(?:/[\w./%-]*)?'
+    r'|(?:behance\.net|dribbble\.com)/[\w-]+'
+)
+
+CONTACT_FIELDS = ('email', 'phone', 'linkedin', 'github', 'portfolio')
+
+# All contact patterns as one alternation, so a single scan finds every field. Every
+# field starts where no word character precedes it; checking that first rejects most
+# positions (the middle of ordinary words) before any alternative is tried.
+CONTACT = re.compile(r'(?<!\w)(?:' + '|'.join(
+    f'(?P<{field}>{pattern.pattern})'
+    for field, pattern in zip(CONTACT_FIELDS, (EMAIL, PHONE, LINKEDIN, GITHUB, PORTFOLIO))
+) + ')')
+
+# Contact details as check_formatting expects them to be written
+FORMATTED_CONTACT = re.compile(
+    r'\b[\w\.-]+@[\w\.-]+\.\w+\b'       # email
+    r'|\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'   # phone
+    r'|linkedin\.com/\w+'               # LinkedIn
+)
+
+# Resume content checks -------------------------------------------------------
+
+SUMMARY_CONTACT_WORDS = re.compile(r'\b(?:email|phone|address|tel|mobile|linkedin)\b')
+YEAR = re.compile(r'\b(?:19|20)\d{2}\b')
+BULLET = re.compile(r'[•\-\*]')
+ACTION_VERB = re.compile(r'\b(?:developed|managed|created|implemented|designed|led|improved)\b')
+DEGREE = re.compile(r'\b(?:bachelor|master|phd|b\.|m\.|diploma)\b')
+GPA = re.compile(r'\b(?:gpa|cgpa|grade|percentage)\b')
+
+# AI analysis output ----------------------------------------------------------
+
+RESUME_SCORE_OUT_OF_100 = re.compile(r'Resume Score:\s*(\d{1,3})/100')
+RESUME_SCORE = re.compile(r'\bResume Score:\s*(\d{1,3})\b')
+ATS_SCORE_OUT_OF_100 = re.compile(r'ATS Score:\s*(\d{1,3})/100')
+FIRST_NUMBER = re.compile(r'\b(\d{1,3})\b')
+
+MARKDOWN_BOLD = re.compile(r'\*\*(.*?)\*\*')
+MARKDOWN_ITALIC = re.compile(r'\*(.*?)\*')
+MARKDOWN_UNDERSCORE_BOLD = re.compile(r'__(.*?)__')
+MARKDOWN_UNDERSCORE_ITALIC = re.compile(r'_(.*?)_')
+MARKDOWN_HEADER = re.compile(r'^#{1,6}\s+', re.MULTILINE)
+MARKDOWN_LINK = re.compile(r'\[(.*?)\]\(.*?\)')
+
+PATTERNS = {
+    name: value for name, value in globals().items()
+    if name.isupper() and isinstance(value, re.Pattern)
+}
+
+
+def extract_contact_info(text):
+    """
+    Find the first email, phone, LinkedIn, GitHub and portfolio match in one scan.
+
+    Returns a dict with every CONTACT_FIELDS key ('' when absent). Matches do not
+    overlap, so digits inside an email are not reported as a phone number.
+    """
+    found = dict.fromkeys(CONTACT_FIELDS, '')
+    missing = len(CONTACT_FIELDS)
+    for match in CONTACT.finditer(text):
+        field = match.lastgroup
+        if not found[field]:
+            found[field] = match.group(field)
+            missing -= 1
+            if not missing:
+                break
+    return found
+
+
+def clean_markdown(text):
+    """Strip bold/italic markers, headers and links from markdown text"""
+    if not text:
+        return ""
+    text = MARKDOWN_BOLD.sub(r'\1', text)
+    text = MARKDOWN_ITALIC.sub(r'\1', text)
+    text = MARKDOWN_UNDERSCORE_BOLD.sub(r'\1', text)
+    text = MARKDOWN_UNDERSCORE_ITALIC.sub(r'\1', text)
+    text = MARKDOWN_HEADER.sub('', text)
+    text = MARKDOWN_LINK.sub(r'\1', text)
+    return text.strip()
+
+
+def benchmark_patterns(texts, repeat=20):
+    """
+    Time every registered pattern over texts.
+
+    Returns {name: microseconds per text} for one search, plus 'extract_contact_info'
+    and 'contact_separate' (the five contact patterns searched one by one) for
+    comparing the single-scan extractor against separate searches.
+    """
+    texts = list(texts)
+    runs = repeat * max(1, len(texts))
+
+    def timed(func):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for text in texts:
+                func(text)
+        return (time.perf_counter() - start) / runs * 1e6
+
+    results = {name: timed(pattern.search) for name, pattern in sorted(PATTERNS.items())}
+    results['extract_contact_info'] = timed(extract_contact_info)
+    separate = (EMAIL, PHONE, LINKEDIN, GITHUB, PORTFOLIO)
+    results['contact_separate'] = timed(lambda text: [p.search(text) for p in separate])
+    return results
+
+
+if __name__ == '__main__':
+    import sys
+
+    texts = []
+    for path in sys.argv[1:]:
+        with open(path, encoding='utf-8', errors='ignore') as f:
+            texts.append(f.read())
+    if not texts:
+        print("usage: python -m utils.patterns RESUME.txt [...]")
+        sys.exit(1)
+
+    for name, micros in sorted(benchmark_patterns(texts).items(), key=lambda item: -item[1]):
+        print(f"{name:28s} {micros:10.1f} us")
@@ -0,0 +1,206 @@
+"""
+Per-page PDF text extraction engine.
+
+pdfplumber and pypdf are pure Python and hold the GIL, so threads do not help with
+long documents. Multi-page PDFs are split into contiguous page ranges that are
+extracted in a bounded process pool and joined back in page order. Short documents
+stay on the serial path where pool overhead would dominate.
+"""
+
+import multiprocessing
+import os
+import threading
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from .upload import UploadedDocument, open_stream
+
+# Number of worker processes used for page extraction
+PDF_POOL_WORKERS = int(os.getenv("PDF_POOL_WORKERS", str(min(4, os.cpu_count() or 1))))
+# Documents with fewer pages than this are extracted serially
+PDF_PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "3"))
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _iter_pdfplumber_pages(file_content, start, stop):
+    import pdfplumber
+
+    with pdfplumber.open(open_stream(file_content)) as pdf:
+        for page in pdf.pages[start:stop]:
+            try:
+                # Suppress specific warnings about PDFColorSpace conversion
+                with warnings.catch_warnings():
+                    warnings.filterwarnings("ignore", message=".*PDFColorSpace.*")
+                    warnings.filterwarnings("ignore", message=".*Cannot convert.*")
+                    page_text, error = page.extract_text() or "", None
+            except MemoryError:
+                raise  # A memory budget must stop the parse, not blank one page
+            except Exception as e:
+                page_text, error = "", str(e)
+            yield page_text, error
+
+
+def _iter_pypdf_pages(file_content, start, stop):
+    import pypdf
+
+    reader = pypdf.PdfReader(open_stream(file_content))
+    for page in reader.pages[start:stop]:
+        try:
+            page_text, error = page.extract_text() or "", None
+        except MemoryError:
+            raise
+        except Exception as e:
+            page_text, error = "", str(e)
+        yield page_text, error
+
+
+_BACKENDS = {
+    'pdfplumber': _iter_pdfplumber_pages,
+    'pypdf': _iter_pypdf_pages,
+}
+
+
+def _extract_range(file_content, backend, start, stop):
+    """Worker entry point: extract pages [start, stop) with the given backend"""
+    texts, errors = [], []
+    for page_text, error in _BACKENDS[backend](file_content, start, stop):
+        texts.append(page_text)
+        if error:
+            errors.append(error)
+    return texts, errors
+
+
+def count_pages(file_content):
+    """Return the number of pages in a PDF without extracting any text"""
+    import pypdf
+
+    return len(pypdf.PdfReader(open_stream(file_content)).pages)
+
+
+def _get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # Spawned workers are safe to start from Streamlit's threaded server
+            _pool = ProcessPoolExecutor(
+                max_workers=PDF_POOL_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def _reset_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def _page_ranges(page_count, chunks):
+    """Split page_count pages into at most `chunks` contiguous, ordered ranges"""
+    chunks = max(1, min(chunks, page_count))
+    size, extra = divmod(page_count, chunks)
+    ranges, start = [], 0
+    for i in range(chunks):
+        stop = start + size + (1 if i < extra else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def extract_pdf_pages(file_content, backend='pdfplumber', page_count=None):
+    """
+    Extract the text of every page of a PDF given as bytes or an UploadedDocument.
+
+    Returns a tuple (pages, errors) where pages holds one string per page in
+    document order ("" for pages without text) and errors lists per-page failures.
+    """
+    if backend not in _BACKENDS:
+        raise ValueError(f"Unknown PDF backend: {backend}")
+
+    if page_count is None:
+        try:
+            page_count = count_pages(file_content)
+        except Exception:
+            page_count = 0
+
+    if page_count < PDF_PARALLEL_MIN_PAGES or PDF_POOL_WORKERS <= 1:
+        return _extract_range(file_content, backend, 0, None)
+
+    try:
+        pool = _get_pool()
+        if isinstance(file_content, UploadedDocument):
+            file_content = file_content.tobytes()  # Memoryviews cannot be pickled to workers
+        futures = [
+            pool.submit(_extract_range, file_content, backend, start, stop)
+            for start, stop in _page_ranges(page_count, PDF_POOL_WORKERS)
+        ]
+        pages, errors = [], []
+        for future in futures:  # Futures are consumed in submission (page) order
+            texts, range_errors = future.result()
+            pages.extend(texts)
+            errors.extend(range_errors)
+        return pages, errors
+    except (BrokenProcessPool, RuntimeError, OSError) as e:
+        print(f"Parallel PDF extraction unavailable, falling back to serial: {e}")
+        _reset_pool()
+        return _extract_range(file_content, backend, 0, None)
+
+
+def iter_pdf_pages(file_content, backend='pdfplumber', page_count=None):
+    """
+    Yield the text of each page of a PDF in document order as soon as it is available.
+
+    Short documents are read page by page in-process. Longer ones are fanned out to the
+    process pool with the first page submitted on its own, so callers can start working
+    on it while the remaining ranges are still being extracted.
+    """
+    if backend not in _BACKENDS:
+        raise ValueError(f"Unknown PDF backend: {backend}")
+
+    if page_count is None:
+        try:
+            page_count = count_pages(file_content)
+        except Exception:
+            page_count = 0
+
+    if page_count < PDF_PARALLEL_MIN_PAGES or PDF_POOL_WORKERS <= 1:
+        for page_text, _ in _BACKENDS[backend](file_content, 0, None):
+            yield page_text
+        return
+
+    try:
+        pool = _get_pool()
+        payload = file_content.tobytes() if isinstance(file_content, UploadedDocument) else file_content
+        ranges = [(0, 1)] + [
+            (start + 1, stop + 1) for start, stop in _page_ranges(page_count - 1, PDF_POOL_WORKERS)
+        ]
+        futures = [pool.submit(_extract_range, payload, backend, start, stop) for start, stop in ranges]
+    except (BrokenProcessPool, RuntimeError, OSError) as e:
+        print(f"Parallel PDF extraction unavailable, falling back to serial: {e}")
+        _reset_pool()
+        for page_text, _ in _BACKENDS[backend](file_content, 0, None):
+            yield page_text
+        return
+
+    # Futures are consumed in submission (page) order
+    for (start, _), future in zip(ranges, futures):
+        try:
+            texts, _ = future.result()
+        except BrokenProcessPool as e:
+            print(f"PDF extraction worker died, finishing serially: {e}")
+            _reset_pool()
+            for page_text, _ in _BACKENDS[backend](file_content, start, None):
+                yield page_text
+            return
+        yield from texts
+
+
+def extract_pdf_text(file_content, backend='pdfplumber'):
+    """Extract the text of a PDF as one string with pages separated by newlines"""
+    pages, _ = extract_pdf_pages(file_content, backend)
+    return "\n".join(pages)
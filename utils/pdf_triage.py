@@ -0,0 +1,144 @@
+"""
+Cheap up-front PDF triage.
+
+Looks at the first few pages' resources (fonts, image XObjects) and a sample of their
+text layer to pick an extraction backend before any full parse happens:
+
+- 'text':   a clean text layer; the fast pypdf path is enough
+- 'layout': fonts are present but pypdf's output is sparse or garbled; use pdfplumber
+- 'ocr':    no usable text layer (scanned/image-only); go straight to OCR
+"""
+
+import os
+import threading
+from collections import Counter
+
+from .ocr import OCR_MIN_PAGE_CHARS, text_density
+from .upload import open_stream
+
+TRIAGE_SAMPLE_PAGES = int(os.getenv("TRIAGE_SAMPLE_PAGES", "3"))
+# Share of sampled characters that must be letters, digits or punctuation to trust pypdf
+TRIAGE_MIN_CLEAN_RATIO = float(os.getenv("TRIAGE_MIN_CLEAN_RATIO", "0.8"))
+
+_decisions = Counter()
+_decisions_lock = threading.Lock()
+
+
+def _resolve(obj):
+    return obj.get_object() if hasattr(obj, 'get_object') else obj
+
+
+def _page_resources(page):
+    """Return (font count, image count, whether any font is unlikely to decode cleanly)"""
+    resources = _resolve(page.get('/Resources')) or {}
+    fonts = _resolve(resources.get('/Font')) or {}
+    xobjects = _resolve(resources.get('/XObject')) or {}
+
+    missing_unicode = False
+    for font in fonts.values():
+        font = _resolve(font)
+        subtype = font.get('/Subtype')
+        # Type3 glyphs and composite fonts without a ToUnicode map rarely decode cleanly
+        if subtype == '/Type3' or (subtype == '/Type0' and '/ToUnicode' not in font):
+            missing_unicode = True
+
+    images = 0
+    for xobject in xobjects.values():
+        if _resolve(xobject).get('/Subtype') == '/Image':
+            images += 1
+    return len(fonts), images, missing_unicode
+
+
+def _clean_ratio(text):
+    chars = [ch for ch in text if not ch.isspace()]
+    if not chars:
+        return 0.0
+    clean = sum(1 for ch in chars if ch.isalnum() or ch in '.,;:()[]{}@/+-_&%#\'"!?|•*')
+    return clean / len(chars)
+
+
+def triage_pdf(source, sample_pages=TRIAGE_SAMPLE_PAGES):
+    """
+    Inspect the first pages of a PDF and decide which extraction backend to use.
+
+    Returns a dict with 'backend' ('text', 'layout' or 'ocr'), a short 'reason' and
+    the sampled signals ('page_count', 'pages_sampled', 'fonts', 'images',
+    'text_chars', 'clean_ratio').
+    """
+    import pypdf
+
+    reader = pypdf.PdfReader(open_stream(source))
+    page_count = len(reader.pages)
+    sampled = reader.pages[:max(1, sample_pages)]
+
+    fonts = images = 0
+    missing_unicode = False
+    sample_text = []
+    for page in sampled:
+        page_fonts, page_images, page_missing_unicode = _page_resources(page)
+        fonts += page_fonts
+        images += page_images
+        missing_unicode = missing_unicode or page_missing_unicode
+        if page_fonts:
+            try:
+                sample_text.append(page.extract_text() or "")
+            except MemoryError:
+                raise
+            except Exception:
+                sample_text.append("")
+
+    text = "\n".join(sample_text)
+    text_chars = text_density(text)
+    clean_ratio = _clean_ratio(text)
+
+    if not fonts or text_chars < OCR_MIN_PAGE_CHARS * len(sampled):
+        if images or not fonts:
+            backend, reason = 'ocr', 'no usable text layer on sampled pages'
+        else:
+            backend, reason = 'layout', 'sparse text layer'
+    elif clean_ratio < TRIAGE_MIN_CLEAN_RATIO or missing_unicode:
+        backend, reason = 'layout', 'text layer needs font-aware decoding'
+    else:
+        backend, reason = 'text', 'clean text layer'
+
+    decision = {
+        'backend': backend,
+        'reason': reason,
+        'page_count': page_count,
+        'pages_sampled': len(sampled),
+        'fonts': fonts,
+        'images': images,
+        'text_chars': text_chars,
+        'clean_ratio': round(clean_ratio, 3),
+    }
+    record_triage_decision(decision)
+    return decision
+
+
+def scanned_pages(source, page_indices):
+    """
+    Return the pages among page_indices that look scanned: no fonts, or an image XObject.
+
+    A page with fonts and no images is typed even when it holds little text (a short
+    last page, a divider), so rasterizing it would not recover anything.
+    """
+    import pypdf
+
+    reader = pypdf.PdfReader(open_stream(source))
+    scanned = []
+    for index in page_indices:
+        fonts, images, _ = _page_resources(reader.pages[index])
+        if not fonts or images:
+            scanned.append(index)
+    return scanned
+
+
+def record_triage_decision(decision):
+    with _decisions_lock:
+        _decisions[decision['backend']] += 1
+
+
+def get_triage_stats():
+    """Return how many PDFs each backend was chosen for in this process"""
+    with _decisions_lock:
+        return dict(_decisions)
@@ -1,7 +1,30 @@
-import re
+from . import patterns
+from .analysis_cache import get_analysis_cache
+from .docx_extraction import extract_docx_text
+from .extraction_cache import get_extraction_cache
+from .extraction_sandbox import EXTRACTION_SANDBOX, SandboxedPdfExtraction
+from .keyword_matcher import get_matcher
+from .pdf_extraction import iter_pdf_pages
+from .resume_document import as_document
+from .resume_sections import SECTION_KEYWORDS, SectionSegmenter
+from .timing import TIMING_DEBUG, collect_spans, span, spans_to_timings, timed, timed_iter
+from .upload import UploadedDocument
 
 class ResumeAnalyzer:
+    # Bump whenever extraction output changes so cached text is not reused
+    EXTRACTOR_VERSION = 3
+    # Bump whenever analyze_resume output changes so cached results are dropped
+    ANALYZER_VERSION = 1
+
     def __init__(self):
+        self.cache = get_extraction_cache()
+        self.result_cache = get_analysis_cache(self.ANALYZER_VERSION)
+        # Set when the last PDF extraction stopped early on a time, memory or page budget
+        self.last_budget_exceeded = None
+        # Set by iter_text_from_pdf once the pages yielded so far are the whole document
+        # (always the case for a cache hit, which yields the full text at once)
+        self.last_extraction_complete = False
+
         # Document type indicators
         self.document_types = {
             'resume': [
@@ -21,16 +44,31 @@ class ResumeAnalyzer:
                 'date of issue', 'identification'
             ]
         }
+
+        # Substring matcher over every document type keyword, compiled once
+        self.document_type_matcher = get_matcher(
+            [keyword for keywords in self.document_types.values() for keyword in keywords],
+            word_boundary=False
+        )
+
+        # One-pass line classifier shared by the section extractors
+        self.segmenter = SectionSegmenter(SECTION_KEYWORDS, self.document_types['resume'])
+        self._section_index = None
         
+    @timed('document_type')
     def detect_document_type(self, text):
-        text = text.lower()
+        document = as_document(text)
         scores = {}
         
+        # Find the keywords of every document type in a single scan
+        found = self.document_type_matcher.found(document)
+        word_count = document.word_count
+        
         # Calculate score for each document type
         for doc_type, keywords in self.document_types.items():
-            matches = sum(1 for keyword in keywords if keyword in text)
+            matches = sum(1 for keyword in keywords if keyword in found)
             density = matches / len(keywords)
-            frequency = matches / (len(text.split()) + 1)  # Add 1 to avoid division by zero
+            frequency = matches / (word_count + 1)  # Add 1 to avoid division by zero
             scores[doc_type] = (density * 0.7) + (frequency * 0.3)
         
         # Get the highest scoring document type
@@ -39,18 +77,15 @@ class ResumeAnalyzer:
         # Only return a document type if the score is significant
         return best_match[0] if best_match[1] > 0.15 else 'unknown'
         
+    @timed('keyword_match')
     def calculate_keyword_match(self, resume_text, required_skills):
-        resume_text = resume_text.lower()
         found_skills = []
         missing_skills = []
         
+        # All skills are located in one pass; whole words only, so "Java" is not found in "JavaScript"
+        present = get_matcher(required_skills, word_boundary=True).found(resume_text)
         for skill in required_skills:
-            skill_lower = skill.lower()
-            # Check for exact match
-            if skill_lower in resume_text:
-                found_skills.append(skill)
-            # Check for partial matches (e.g., "Python" in "Python programming")
-            elif any(skill_lower in phrase for phrase in resume_text.split('.')):
+            if skill in present:
                 found_skills.append(skill)
             else:
                 missing_skills.append(skill)
@@ -63,8 +98,14 @@ class ResumeAnalyzer:
             'missing_skills': missing_skills
         }
         
+    def rank_roles(self, resume_text, job_roles, top_n=None):
+        """Score the resume against every role in job_roles at once, best fit first"""
+        from .role_matcher import get_role_fit_matrix
+        return get_role_fit_matrix(job_roles).rank(resume_text, top_n=top_n)
+        
+    @timed('section_score')
     def check_resume_sections(self, text):
-        text = text.lower()
+        document = as_document(text)
         essential_sections = {
             'contact': ['email', 'phone', 'address', 'linkedin'],
             'education': ['education', 'university', 'college', 'degree', 'academic'],
@@ -72,381 +113,255 @@ class ResumeAnalyzer:
             'skills': ['skills', 'technologies', 'tools', 'proficiencies', 'expertise']
         }
         
+        present = get_matcher(
+            [keyword for keywords in essential_sections.values() for keyword in keywords],
+            word_boundary=False
+        ).found(document)
+        
         section_scores = {}
         for section, keywords in essential_sections.items():
-            found = sum(1 for keyword in keywords if keyword in text)
+            found = sum(1 for keyword in keywords if keyword in present)
             section_scores[section] = min(25, (found / len(keywords)) * 25)
             
         return sum(section_scores.values())
         
+    @timed('formatting')
     def check_formatting(self, text):
-        lines = text.split('\n')
+        document = as_document(text)
+        text = document.text
         score = 100
         deductions = []
         
+        # Headers, bullets and blank-line runs are all found in one pass over the lines
+        has_headers = has_bullets = double_blank = False
+        previous_blank = False
+        for line in document.stripped_lines:
+            if not has_headers and line.isupper():
+                has_headers = True
+            if not has_bullets and line.startswith(('•', '-', '*', '→')):
+                has_bullets = True
+            if not line:
+                if previous_blank:
+                    double_blank = True
+                previous_blank = True
+            else:
+                previous_blank = False
+        
         # Check for minimum content
         if len(text) < 300:
             score -= 30
             deductions.append("Resume is too short")
             
         # Check for section headers
-        if not any(line.isupper() for line in lines):
+        if not has_headers:
             score -= 20
             deductions.append("No clear section headers found")
             
         # Check for bullet points
-        if not any(line.strip().startswith(('•', '-', '*', '→')) for line in lines):
+        if not has_bullets:
             score -= 20
             deductions.append("No bullet points found for listing details")
             
         # Check for consistent spacing
-        if any(len(line.strip()) == 0 and len(next_line.strip()) == 0 
-               for line, next_line in zip(lines[:-1], lines[1:])):
+        if double_blank:
             score -= 15
             deductions.append("Inconsistent spacing between sections")
             
-        # Check for contact information format
-        contact_patterns = [
-            r'\b[\w\.-]+@[\w\.-]+\.\w+\b',  # email
-            r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',  # phone
-            r'linkedin\.com/\w+',  # LinkedIn
-        ]
-        if not any(re.search(pattern, text) for pattern in contact_patterns):
+        # Check for contact information format (email, phone or LinkedIn)
+        if not patterns.FORMATTED_CONTACT.search(text):
             score -= 15
             deductions.append("Missing or improperly formatted contact information")
             
         return max(0, score), deductions
         
-    def extract_text_from_pdf(self, file):
+    def iter_text_from_pdf(self, file):
+        """Yield the text of each PDF page as soon as it has been extracted"""
         try:
-            import PyPDF2
-            import io
+            # Wrap the upload once; parsers read views over the same buffer
+            document = UploadedDocument.from_upload(file)
+            self.last_budget_exceeded = None
+            self.last_extraction_complete = False
+            with span('extract.cache'):
+                cached = self.cache.get(document, 'resume_analyzer.pdf', self.EXTRACTOR_VERSION)
+            if cached:
+                self.last_extraction_complete = True
+                yield cached['text']
+                return
             
-            # Create a PDF reader object
-            # First make sure we have the file content as bytes
-            if hasattr(file, 'read'):
-                # If it's already a file-like object, read it
-                file_content = file.read()
-                file.seek(0)  # Reset file pointer
+            # Untrusted uploads are parsed in a supervised child process with time,
+            # memory and page budgets; partial text is kept when a budget runs out
+            if EXTRACTION_SANDBOX:
+                extraction = SandboxedPdfExtraction(document, 'pypdf')
             else:
-                # If it's already bytes
-                file_content = file
-                
-            # Create BytesIO from bytes content
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_content))
+                extraction = iter_pdf_pages(document, 'pypdf')
             
-            # Extract text from all pages
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-                
-            return text
+            pages = []
+            for page_text in timed_iter('extract.pdf', extraction):
+                page_text += "\n"
+                pages.append(page_text)
+                # The sandbox reports the page count before the first page
+                page_count = getattr(extraction, 'page_count', None)
+                self.last_extraction_complete = page_count is not None and len(pages) >= page_count
+                yield page_text
+            
+            self.last_budget_exceeded = getattr(extraction, 'budget_exceeded', None)
+            if not self.last_budget_exceeded:
+                self.cache.set(document, 'resume_analyzer.pdf', self.EXTRACTOR_VERSION, ''.join(pages), 'pypdf')
         except Exception as e:
             raise Exception(f"Error extracting text from PDF: {str(e)}")
+    
+    def extract_text_from_pdf(self, file):
+        """Extract text from all pages of a PDF file"""
+        return ''.join(self.iter_text_from_pdf(file))
             
+    @timed('extract.docx')
     def extract_text_from_docx(self, docx_file):
         """Extract text from a DOCX file"""
         try:
-            from docx import Document
-            doc = Document(docx_file)
-            full_text = []
-            for paragraph in doc.paragraphs:
-                full_text.append(paragraph.text)
-            return '\n'.join(full_text)
+            document = UploadedDocument.from_upload(docx_file)
+            cached = self.cache.get(document, 'resume_analyzer.docx', self.EXTRACTOR_VERSION)
+            if cached:
+                return cached['text']
+            # Stream the document XML; also picks up tables, text boxes, headers and footers
+            text = extract_docx_text(document)
+            self.cache.set(document, 'resume_analyzer.docx', self.EXTRACTOR_VERSION, text, 'docx-xml')
+            return text
         except Exception as e:
             raise Exception(f"Error extracting text from DOCX file: {str(e)}")
 
+    @timed('personal_info')
     def extract_personal_info(self, text):
         """Extract personal information from resume text"""
-        # Basic patterns for personal info
-        email_pattern = r'[\w\.-]+@[\w\.-]+\.\w+'
-        phone_pattern = r'(\+\d{1,3}[-.]?)?\s*\(?\d{3}\)?[-.]?\s*\d{3}[-.]?\s*\d{4}'
-        linkedin_pattern = r'linkedin\.com/in/[\w-]+'
-        github_pattern = r'github\.com/[\w-]+'
+        document = as_document(text)
         
-        # Extract information
-        email = re.search(email_pattern, text)
-        phone = re.search(phone_pattern, text)
-        linkedin = re.search(linkedin_pattern, text)
-        github = re.search(github_pattern, text)
+        # Email, phone, LinkedIn, GitHub and portfolio in a single scan
+        contact = patterns.extract_contact_info(document.text)
         
         # Get the first line as name (basic assumption)
-        name = text.split('\n')[0].strip()
+        name = document.stripped_lines[0]
         
         return {
             'name': name if len(name) > 0 else 'Unknown',
-            'email': email.group(0) if email else '',
-            'phone': phone.group(0) if phone else '',
-            'linkedin': linkedin.group(0) if linkedin else '',
-            'github': github.group(0) if github else '',
-            'portfolio': ''  # Can be enhanced later
+            **contact
         }
 
+    @timed('sections.segment')
+    def segment_sections(self, text):
+        """Classify every line once and return the reusable section index for text"""
+        document = as_document(text)
+        # The five section extractors run back to back on the same document
+        if self._section_index is not None and self._section_index[0] == document:
+            return self._section_index[1]
+        index = self.segmenter.segment(document)
+        self._section_index = (document, index)
+        return index
+
+    @timed('sections.education')
     def extract_education(self, text):
         """Extract education information from resume text"""
-        education = []
-        lines = text.split('\n')
-        education_keywords = [
-            'education', 'academic', 'qualification', 'degree', 'university', 'college',
-            'school', 'institute', 'certification', 'diploma', 'bachelor', 'master',
-            'phd', 'b.tech', 'm.tech', 'b.e', 'm.e', 'b.sc', 'm.sc','bca', 'mca', 'b.com',
-            'm.com', 'b.cs-it', 'imca', 'bba', 'mba', 'honors', 'scholarship'
-        ]
-        in_education_section = False
-        current_entry = []
-
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in education_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in education_keywords):
-                    # This line contains education info, not just a header
-                    current_entry.append(line)
-                in_education_section = True
-                continue
-            
-            if in_education_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(edu_key.lower() in line.lower() for edu_key in education_keywords):
-                        in_education_section = False
-                        if current_entry:
-                            education.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    education.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            education.append(' '.join(current_entry))
-        
-        return education
+        return self.segment_sections(text).entry_texts('education')
 
+    @timed('sections.experience')
     def extract_experience(self, text):
         """Extract work experience information from resume text"""
-        experience = []
-        lines = text.split('\n')
-        experience_keywords = [
-            'experience', 'employment', 'work history', 'professional experience',
-            'work experience', 'career history', 'professional background',
-            'employment history', 'job history', 'positions held', 'experience',
-            'job title', 'job responsibilities', 'job description', 'job summary'
-        ]
-        in_experience_section = False
-        current_entry = []
-
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in experience_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in experience_keywords):
-                    # This line contains experience info, not just a header
-                    current_entry.append(line)
-                in_experience_section = True
-                continue
-            
-            if in_experience_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(exp_key.lower() in line.lower() for exp_key in experience_keywords):
-                        in_experience_section = False
-                        if current_entry:
-                            experience.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    experience.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            experience.append(' '.join(current_entry))
-        
-        return experience
+        return self.segment_sections(text).entry_texts('experience')
 
+    @timed('sections.projects')
     def extract_projects(self, text):
         """Extract project information from resume text"""
-        projects = []
-        lines = text.split('\n')
-        project_keywords = [
-            'projects', 'personal projects', 'academic projects', 'key projects',
-            'major projects', 'professional projects', 'project experience',
-            'relevant projects', 'featured projects','latest projects',
-            'top projects'
-        ]
-        in_project_section = False
-        current_entry = []
-
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in project_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in project_keywords):
-                    # This line contains project info, not just a header
-                    current_entry.append(line)
-                in_project_section = True
-                continue
-            
-            if in_project_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(proj_key.lower() in line.lower() for proj_key in project_keywords):
-                        in_project_section = False
-                        if current_entry:
-                            projects.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    projects.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            projects.append(' '.join(current_entry))
-        
-        return projects
+        return self.segment_sections(text).entry_texts('projects')
 
+    @timed('sections.skills')
     def extract_skills(self, text):
         """Extract skills from resume text"""
         skills = set()  # Use set to avoid duplicates
-        lines = text.split('\n')
-        skills_keywords = [
-            'skills', 'technical skills', 'competencies', 'expertise',
-            'core competencies', 'professional skills', 'key skills',
-            'technical expertise', 'proficiencies', 'qualifications',
-            'top skills', 'key skill', 'major skill', 'personal skill',
-            'soft skills', 'soft skill', 'soft skillset'
-        ]
-        in_skills_section = False
-        current_entry = []
 
         # Common skill separators
         separators = [',', '•', '|', '/', '\\', '·', '>', '-', '–', '―']
 
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in skills_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in skills_keywords):
-                    # This line contains skills, not just a header
-                    current_entry.append(line)
-                in_skills_section = True
-                continue
-            
-            if in_skills_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(skill_key.lower() in line.lower() for skill_key in skills_keywords):
-                        in_skills_section = False
-                        if current_entry:
-                            # Process the current entry
-                            text_to_process = ' '.join(current_entry)
-                            # Split by common separators
-                            for separator in separators:
-                                if separator in text_to_process:
-                                    skills.update(skill.strip() for skill in text_to_process.split(separator) if skill.strip())
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    # Process the current entry
-                    text_to_process = ' '.join(current_entry)
-                    # Split by common separators
-                    for separator in separators:
-                        if separator in text_to_process:
-                            skills.update(skill.strip() for skill in text_to_process.split(separator) if skill.strip())
-                    current_entry = []
-        
-        if current_entry:
-            # Process any remaining skills
-            text_to_process = ' '.join(current_entry)
+        for text_to_process in self.segment_sections(text).entry_texts('skills'):
+            # Split by common separators
             for separator in separators:
                 if separator in text_to_process:
                     skills.update(skill.strip() for skill in text_to_process.split(separator) if skill.strip())
         
         return list(skills)
 
+    @timed('sections.summary')
     def extract_summary(self, text):
         """Extract summary/objective from resume text"""
         summary = []
-        lines = text.split('\n')
-        summary_keywords = [
-            'summary', 'professional summary', 'career summary', 'objective',
-            'career objective', 'professional objective', 'about me', 'profile',
-            'professional profile', 'career profile', 'overview', 'skill summary'
-        ]
-        in_summary_section = False
-        current_entry = []
+        index = self.segment_sections(text)
+        lines = index.lines
+        summary_keywords = SECTION_KEYWORDS['summary']
 
         # Try to find summary at the beginning of the resume
         start_index = 0
-        while start_index < min(10, len(lines)) and not lines[start_index].strip():
+        while start_index < min(10, len(lines)) and not lines[start_index]:
             start_index += 1
 
         # Check first few non-empty lines for potential summary
         first_lines = []
-        lines_checked = 0
         for line in lines[start_index:]:
-            if line.strip():
-                first_lines.append(line.strip())
-                lines_checked += 1
-                if lines_checked >= 5:  # Check first 5 non-empty lines
+            if line:
+                first_lines.append(line)
+                if len(first_lines) >= 5:  # Check first 5 non-empty lines
                     break
 
         # If first few lines look like a summary (no special formatting, no contact info)
         if first_lines and not any(keyword in first_lines[0].lower() for keyword in summary_keywords):
             potential_summary = ' '.join(first_lines)
             if len(potential_summary.split()) > 10:  # More than 10 words
-                if not re.search(r'\b(?:email|phone|address|tel|mobile|linkedin)\b', potential_summary.lower()):
+                if not patterns.SUMMARY_CONTACT_WORDS.search(potential_summary.lower()):
                     summary.append(potential_summary)
 
         # Look for explicitly marked summary section
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in summary_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in summary_keywords):
-                    # This line contains summary info, not just a header
-                    current_entry.append(line)
-                in_summary_section = True
-                continue
-            
-            if in_summary_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(sum_key.lower() in line.lower() for sum_key in summary_keywords):
-                        in_summary_section = False
-                        if current_entry:
-                            summary.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    summary.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            summary.append(' '.join(current_entry))
+        summary.extend(index.entry_texts('summary'))
         
         return ' '.join(summary) if summary else ''
 
-    def analyze_resume(self, resume_data, job_requirements):
-        """Analyze resume and return scores and recommendations"""
+    def analyze_many(self, resumes, job_requirements, workers=None, chunksize=None, ordered=True):
+        """
+        Analyze many resumes against the same job requirements in a process pool.
+        
+        Yields (index, analysis) pairs; see utils.batch_analysis.analyze_many.
+        """
+        from .batch_analysis import BATCH_CHUNKSIZE, BATCH_WORKERS, analyze_many
+        return analyze_many(
+            resumes, job_requirements,
+            workers=BATCH_WORKERS if workers is None else workers,
+            chunksize=BATCH_CHUNKSIZE if chunksize is None else chunksize,
+            ordered=ordered
+        )
+
+    def analyze_resume(self, resume_data, job_requirements, use_cache=True):
+        """
+        Analyze resume and return scores and recommendations.
+
+        Pass use_cache=False for partial text (e.g. a provisional first-page pass) so its
+        result is neither read from nor written to the analysis cache.
+        """
+        # raw_text may be a plain string or a ResumeDocument built once per upload
+        text = as_document(resume_data.get('raw_text', ''))
+        
+        with collect_spans() as spans, span('analyze'):
+            analysis = None
+            if use_cache:
+                # Text already analyzed for the same requirements is a cache lookup
+                with span('analysis_cache.get'):
+                    analysis = self.result_cache.get(text, job_requirements)
+            if analysis is None:
+                analysis = self._analyze_document(text, job_requirements)
+                if use_cache:
+                    self.result_cache.set(text, job_requirements, analysis)
+        
+        if TIMING_DEBUG:
+            analysis['timings'] = spans_to_timings(spans)
+        return analysis
+
+    def _analyze_document(self, text, job_requirements):
+        """Run every analysis stage over a ResumeDocument"""
         try:
-            text = resume_data.get('raw_text', '')
-            
             # Extract personal information
             personal_info = self.extract_personal_info(text)
             
@@ -489,11 +404,12 @@ class ResumeAnalyzer:
                 contact_suggestions.append("Add your LinkedIn profile URL")
             
             summary_suggestions = []
+            summary_words = len(summary.split())
             if not summary:
                 summary_suggestions.append("Add a professional summary to highlight your key qualifications")
-            elif len(summary.split()) < 30:
+            elif summary_words < 30:
                 summary_suggestions.append("Expand your professional summary to better highlight your experience and goals")
-            elif len(summary.split()) > 100:
+            elif summary_words > 100:
                 summary_suggestions.append("Consider making your summary more concise (aim for 50-75 words)")
             
             skills_suggestions = []
@@ -508,10 +424,9 @@ class ResumeAnalyzer:
             if not experience:
                 experience_suggestions.append("Add your work experience section")
             else:
-                has_dates = any(re.search(r'\b(19|20)\d{2}\b', exp) for exp in experience)
-                has_bullets = any(re.search(r'[•\-\*]', exp) for exp in experience)
-                has_action_verbs = any(re.search(r'\b(developed|managed|created|implemented|designed|led|improved)\b', 
-                                               exp.lower()) for exp in experience)
+                has_dates = any(patterns.YEAR.search(exp) for exp in experience)
+                has_bullets = any(patterns.BULLET.search(exp) for exp in experience)
+                has_action_verbs = any(patterns.ACTION_VERB.search(exp.lower()) for exp in experience)
                 
                 if not has_dates:
                     experience_suggestions.append("Include dates for each work experience")
@@ -524,11 +439,9 @@ class ResumeAnalyzer:
             if not education:
                 education_suggestions.append("Add your educational background")
             else:
-                has_dates = any(re.search(r'\b(19|20)\d{2}\b', edu) for edu in education)
-                has_degree = any(re.search(r'\b(bachelor|master|phd|b\.|m\.|diploma)\b', 
-                                         edu.lower()) for edu in education)
-                has_gpa = any(re.search(r'\b(gpa|cgpa|grade|percentage)\b', 
-                                      edu.lower()) for edu in education)
+                has_dates = any(patterns.YEAR.search(edu) for edu in education)
+                has_degree = any(patterns.DEGREE.search(edu.lower()) for edu in education)
+                has_gpa = any(patterns.GPA.search(edu.lower()) for edu in education)
                 
                 if not has_dates:
                     education_suggestions.append("Include graduation dates")
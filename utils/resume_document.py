@@ -0,0 +1,168 @@
+"""
+Normalized resume text shared by every analysis stage.
+
+A ResumeDocument is built once per upload and handed to all analyzers. Views of the
+text that several stages need (lowercased text, stripped lines, tokens, ...) are
+computed on first use and cached on the document, instead of every stage re-running
+text.lower() / text.split('\\n') / line.strip() over the same full text.
+"""
+
+import hashlib
+import unicodedata
+from bisect import bisect_right
+
+# Characters that NFKC leaves alone but that break word matching in extracted text
+_EXTRA_TRANSLATION = str.maketrans({
+    '\u00ad': None,    # soft hyphen
+    '\u200b': None,    # zero width space
+    '\u200c': None,    # zero width non-joiner
+    '\u200d': None,    # zero width joiner
+    '\ufeff': None,    # byte order mark
+    '\u2018': "'",
+    '\u2019': "'",
+    '\u201c': '"',
+    '\u201d': '"',
+    '\u2013': '-',
+    '\u2014': '-',
+})
+
+_UNSET = object()
+
+
+class ResumeDocument:
+    """
+    Immutable resume text with lazily computed, cached views.
+
+    The document compares, hashes and formats like its text, so it can be passed
+    where a string is expected (str(document) returns the original text).
+    """
+
+    __slots__ = (
+        'text', '_lower', '_lines', '_stripped_lines', '_lower_lines',
+        '_tokens', '_line_offsets', '_normalized', '_sha256',
+    )
+
+    def __init__(self, text):
+        if isinstance(text, ResumeDocument):
+            text = text.text
+        object.__setattr__(self, 'text', text or '')
+        for slot in self.__slots__[1:]:
+            object.__setattr__(self, slot, _UNSET)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ResumeDocument is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("ResumeDocument is immutable")
+
+    def _cache(self, slot, value):
+        object.__setattr__(self, slot, value)
+        return value
+
+    @property
+    def lower(self):
+        """The whole text lowercased"""
+        if self._lower is _UNSET:
+            return self._cache('_lower', self.text.lower())
+        return self._lower
+
+    @property
+    def lines(self):
+        """The text split on newlines, unstripped"""
+        if self._lines is _UNSET:
+            return self._cache('_lines', tuple(self.text.split('\n')))
+        return self._lines
+
+    @property
+    def stripped_lines(self):
+        """Every line with surrounding whitespace removed"""
+        if self._stripped_lines is _UNSET:
+            return self._cache('_stripped_lines', tuple(line.strip() for line in self.lines))
+        return self._stripped_lines
+
+    @property
+    def lower_lines(self):
+        """Every stripped line lowercased"""
+        if self._lower_lines is _UNSET:
+            return self._cache('_lower_lines', tuple(line.lower() for line in self.stripped_lines))
+        return self._lower_lines
+
+    @property
+    def tokens(self):
+        """Whitespace-separated tokens of the text"""
+        if self._tokens is _UNSET:
+            return self._cache('_tokens', tuple(self.text.split()))
+        return self._tokens
+
+    @property
+    def word_count(self):
+        return len(self.tokens)
+
+    @property
+    def line_offsets(self):
+        """Character offset in text at which each line starts"""
+        if self._line_offsets is _UNSET:
+            offsets = []
+            offset = 0
+            for line in self.lines:
+                offsets.append(offset)
+                offset += len(line) + 1
+            return self._cache('_line_offsets', tuple(offsets))
+        return self._line_offsets
+
+    @property
+    def normalized(self):
+        """NFKC-normalized text with ligatures expanded and invisible characters removed"""
+        if self._normalized is _UNSET:
+            text = unicodedata.normalize('NFKC', self.text).translate(_EXTRA_TRANSLATION)
+            return self._cache('_normalized', text)
+        return self._normalized
+
+    @property
+    def sha256(self):
+        """Hex SHA-256 digest of the UTF-8 text"""
+        if self._sha256 is _UNSET:
+            digest = hashlib.sha256(self.text.encode('utf-8', 'surrogatepass')).hexdigest()
+            return self._cache('_sha256', digest)
+        return self._sha256
+
+    def line_at(self, offset):
+        """Return the index of the line containing a character offset"""
+        return bisect_right(self.line_offsets, offset) - 1
+
+    def __str__(self):
+        return self.text
+
+    def __repr__(self):
+        return f"ResumeDocument({len(self.text)} chars, {len(self.lines)} lines)"
+
+    def __len__(self):
+        return len(self.text)
+
+    def __eq__(self, other):
+        if isinstance(other, ResumeDocument):
+            return self is other or self.text == other.text
+        if isinstance(other, str):
+            return self.text == other
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.text)
+
+    def __reduce__(self):
+        # Cached views are cheap to rebuild; only ship the text to worker processes
+        return (ResumeDocument, (self.text,))
+
+
+def as_document(text):
+    """Return text as a ResumeDocument, reusing it when it already is one"""
+    if isinstance(text, ResumeDocument):
+        return text
+    return ResumeDocument(text)
+
+
+def as_text(text):
+    """Return the plain string behind a ResumeDocument or a string"""
+    if isinstance(text, ResumeDocument):
+        return text.text
+    return text
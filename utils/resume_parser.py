@@ -1,44 +1,42 @@
-import pypdf
-import docx
 import re
-from io import BytesIO
+from .extraction_cache import get_extraction_cache
+from .docx_extraction import extract_docx_text
+from .pdf_extraction import extract_pdf_pages
+from .upload import UploadedDocument
 
 class ResumeParser:
+    # Bump whenever extraction output changes so cached text is not reused
+    EXTRACTOR_VERSION = 2
+
     def __init__(self):
-        pass
+        self.cache = get_extraction_cache()
         
     def extract_text_from_pdf(self, pdf_file):
         try:
             # Handle different file input types
-            if hasattr(pdf_file, 'read'):
-                # If it's a file-like object
-                file_content = pdf_file.read()
-                pdf_file.seek(0)  # Reset file pointer
-            else:
-                # If it's already bytes
-                file_content = pdf_file
+            document = UploadedDocument.from_upload(pdf_file)
+            cached = self.cache.get(document, 'resume_parser.pdf', self.EXTRACTOR_VERSION)
+            if cached:
+                return cached['text']
                 
-            pdf_reader = pypdf.PdfReader(BytesIO(file_content))
-            text = ""
-            for page in pdf_reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-                else:
-                    # Handle empty page text
-                    text += "\n"
-            return text.strip()
+            pages, _ = extract_pdf_pages(document, 'pypdf')
+            text = "\n".join(pages)
+            text = text.strip()
+            self.cache.set(document, 'resume_parser.pdf', self.EXTRACTOR_VERSION, text, 'pypdf')
+            return text
         except Exception as e:
             print(f"Error extracting text from PDF: {e}")
             return ""
             
     def extract_text_from_docx(self, docx_file):
         try:
-            doc = docx.Document(BytesIO(docx_file.read()))
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text.strip()
+            document = UploadedDocument.from_upload(docx_file)
+            cached = self.cache.get(document, 'resume_parser.docx', self.EXTRACTOR_VERSION)
+            if cached:
+                return cached['text']
+            text = extract_docx_text(document).strip()
+            self.cache.set(document, 'resume_parser.docx', self.EXTRACTOR_VERSION, text, 'docx-xml')
+            return text
         except Exception as e:
             print(f"Error extracting text from DOCX: {e}")
             return ""
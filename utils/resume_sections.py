@@ -0,0 +1,148 @@
+"""
+Single-pass resume section segmentation.
+
+Every line is classified once against the headers of all sections at the same time,
+and the result is a reusable index of section entries that the education,
+experience, projects, skills and summary extractors all read from.
+"""
+
+import re
+
+from .resume_document import as_document
+
+# Header keywords for each section, matched as lowercase substrings of a line
+SECTION_KEYWORDS = {
+    'education': [
+        'education', 'academic', 'qualification', 'degree', 'university', 'college',
+        'school', 'institute', 'certification', 'diploma', 'bachelor', 'master',
+        'phd', 'b.tech', 'm.tech', 'b.e', 'm.e', 'b.sc', 'm.sc', 'bca', 'mca', 'b.com',
+        'm.com', 'b.cs-it', 'imca', 'bba', 'mba', 'honors', 'scholarship'
+    ],
+    'experience': [
+        'experience', 'employment', 'work history', 'professional experience',
+        'work experience', 'career history', 'professional background',
+        'employment history', 'job history', 'positions held', 'experience',
+        'job title', 'job responsibilities', 'job description', 'job summary'
+    ],
+    'projects': [
+        'projects', 'personal projects', 'academic projects', 'key projects',
+        'major projects', 'professional projects', 'project experience',
+        'relevant projects', 'featured projects', 'latest projects',
+        'top projects'
+    ],
+    'skills': [
+        'skills', 'technical skills', 'competencies', 'expertise',
+        'core competencies', 'professional skills', 'key skills',
+        'technical expertise', 'proficiencies', 'qualifications',
+        'top skills', 'key skill', 'major skill', 'personal skill',
+        'soft skills', 'soft skill', 'soft skillset'
+    ],
+    'summary': [
+        'summary', 'professional summary', 'career summary', 'objective',
+        'career objective', 'professional objective', 'about me', 'profile',
+        'professional profile', 'career profile', 'overview', 'skill summary'
+    ],
+}
+
+# Pseudo-section for the generic resume keywords that end any other section
+BOUNDARY = '_boundary'
+
+
+class SectionIndex:
+    """Stripped lines of a resume plus, per section, its entries as lists of line numbers"""
+
+    def __init__(self, lines, entries):
+        self.lines = lines
+        self.entries = entries
+
+    def entry_texts(self, section):
+        """Return each entry of a section as its lines joined with spaces"""
+        return [' '.join(self.lines[i] for i in entry) for entry in self.entries.get(section, [])]
+
+
+class SectionSegmenter:
+    """
+    Classifies each line against every section's keywords in one scan.
+
+    All keywords are compiled into a single lookahead alternation ordered longest
+    first, so each text position yields the longest keyword starting there. Every
+    shorter keyword that also matches at that position is a prefix of it, so the
+    sections of all keywords matching at a position are precomputed per keyword.
+    """
+
+    def __init__(self, section_keywords=SECTION_KEYWORDS, boundary_keywords=()):
+        keyword_sections = {}
+        for section, keywords in section_keywords.items():
+            for keyword in keywords:
+                keyword_sections.setdefault(keyword.lower(), set()).add(section)
+        for keyword in boundary_keywords:
+            keyword_sections.setdefault(keyword.lower(), set()).add(BOUNDARY)
+
+        self.sections = list(section_keywords)
+        self.header_sections = {
+            keyword: frozenset(sections - {BOUNDARY})
+            for keyword, sections in keyword_sections.items()
+        }
+        self.prefix_sections = {
+            keyword: frozenset().union(*(
+                sections for other, sections in keyword_sections.items()
+                if keyword.startswith(other)
+            ))
+            for keyword in keyword_sections
+        }
+        alternation = '|'.join(
+            re.escape(keyword) for keyword in sorted(keyword_sections, key=len, reverse=True)
+        )
+        self.pattern = re.compile(f'(?=({alternation}))')
+
+    def classify(self, line_lower):
+        """Return the set of sections (and BOUNDARY) with a keyword inside the line"""
+        found = set()
+        for match in self.pattern.finditer(line_lower):
+            found |= self.prefix_sections[match.group(1)]
+        return found
+
+    def segment(self, text):
+        """Split text (a string or ResumeDocument) into a SectionIndex"""
+        document = as_document(text)
+        lines = document.stripped_lines
+        found = []
+        exact = []
+        for line_lower in document.lower_lines:
+            found.append(self.classify(line_lower) if line_lower else set())
+            exact.append(self.header_sections.get(line_lower, frozenset()))
+
+        entries = {}
+        for section in self.sections:
+            section_entries = []
+            in_section = False
+            current_entry = []
+            for i, line in enumerate(lines):
+                # Check for section header
+                if section in found[i]:
+                    if section not in exact[i]:
+                        # This line contains section content, not just a header
+                        current_entry.append(i)
+                    in_section = True
+                    continue
+
+                if in_section:
+                    # Check if we've hit another section
+                    if line and BOUNDARY in found[i]:
+                        in_section = False
+                        if current_entry:
+                            section_entries.append(current_entry)
+                            current_entry = []
+                        continue
+
+                    if line:
+                        current_entry.append(i)
+                    elif current_entry:  # Empty line and we have content
+                        section_entries.append(current_entry)
+                        current_entry = []
+
+            if current_entry:
+                section_entries.append(current_entry)
+            entries[section] = section_entries
+
+        return SectionIndex(lines, entries)
@@ -0,0 +1,90 @@
+"""
+Score a resume against every job role at once.
+
+The required skills of all roles are laid out as a sparse role x skill matrix whose
+rows are weighted by 100 / number of required skills. A resume is turned into a
+skill-presence vector with one keyword scan, and a single sparse product gives the
+keyword-match score of every role, identical to ResumeAnalyzer.calculate_keyword_match.
+"""
+
+import numpy as np
+from scipy import sparse
+
+from .keyword_matcher import KeywordMatcher
+
+
+class RoleFitMatrix:
+    """Precomputed role x skill matrix for ranking all roles against one resume"""
+
+    def __init__(self, job_roles):
+        self.roles = []
+        self.required_skills = []
+        self.skills = []
+        skill_index = {}
+        rows, cols, weights = [], [], []
+
+        for category, roles in job_roles.items():
+            for role, info in roles.items():
+                required = list(info.get('required_skills', []))
+                row = len(self.roles)
+                self.roles.append((category, role))
+                self.required_skills.append(required)
+                for skill in required:
+                    if skill not in skill_index:
+                        skill_index[skill] = len(self.skills)
+                        self.skills.append(skill)
+                    rows.append(row)
+                    cols.append(skill_index[skill])
+                    weights.append(100.0 / len(required))
+
+        # Duplicate (row, col) pairs are summed, matching per-occurrence counting
+        self.matrix = sparse.csr_matrix(
+            (weights, (rows, cols)), shape=(len(self.roles), len(self.skills))
+        )
+        self.skill_index = skill_index
+        self.matcher = KeywordMatcher(self.skills, word_boundary=True)
+
+    def skill_vector(self, resume_text):
+        """Return the 0/1 presence vector of every known skill in the resume"""
+        vector = np.zeros(len(self.skills))
+        for skill in self.matcher.found(resume_text):
+            vector[self.skill_index[skill]] = 1.0
+        return vector
+
+    def scores(self, resume_text):
+        """Return the keyword-match score (0-100) of every role, in self.roles order"""
+        return self.matrix @ self.skill_vector(resume_text)
+
+    def rank(self, resume_text, top_n=None):
+        """Return roles ordered by keyword-match score, best first"""
+        vector = self.skill_vector(resume_text)
+        scores = self.matrix @ vector
+        order = np.argsort(-scores, kind='stable')
+        if top_n is not None:
+            order = order[:top_n]
+
+        ranking = []
+        for row in order:
+            category, role = self.roles[row]
+            required = self.required_skills[row]
+            found = [skill for skill in required if vector[self.skill_index[skill]]]
+            ranking.append({
+                'category': category,
+                'role': role,
+                'score': float(scores[row]),
+                'found_skills': found,
+                'missing_skills': [skill for skill in required if skill not in found],
+            })
+        return ranking
+
+
+_matrices = {}
+
+
+def get_role_fit_matrix(job_roles):
+    """Return the matrix for a job roles catalog, built once per catalog object"""
+    entry = _matrices.get(id(job_roles))
+    if entry is None or entry[0] is not job_roles:
+        entry = (job_roles, RoleFitMatrix(job_roles))
+        _matrices[id(job_roles)] = entry
+    return entry[1]
@@ -0,0 +1,148 @@
+"""
+Lightweight per-stage timing.
+
+Wrap a stage in ``with span('stage'):`` or decorate it with ``@timed('stage')``. Every
+finished span is added to an in-process histogram for its stage (see
+get_stage_stats() for p50/p95/p99), and, inside ``collect_spans()``, also to the list
+of spans for the current request so the timings can be attached to its result.
+Spans may nest; each one is recorded under its own name.
+"""
+
+import contextvars
+import functools
+import math
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# Attach per-stage timings to analysis results
+TIMING_DEBUG = os.getenv("ANALYSIS_TIMING_DEBUG", "0") == "1"
+# How many recent samples each stage histogram keeps
+TIMING_MAX_SAMPLES = int(os.getenv("TIMING_MAX_SAMPLES", "2048"))
+
+_current_spans = contextvars.ContextVar('current_spans', default=None)
+
+
+class StageHistogram:
+    """Recent durations of one stage, in seconds"""
+
+    def __init__(self, max_samples=TIMING_MAX_SAMPLES):
+        self.samples = deque(maxlen=max_samples)
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, seconds):
+        self.samples.append(seconds)
+        self.count += 1
+        self.total += seconds
+
+    def percentile(self, q, ordered=None):
+        """Return the q-th percentile (0-100) of the kept samples, nearest rank"""
+        ordered = ordered if ordered is not None else sorted(self.samples)
+        if not ordered:
+            return 0.0
+        rank = max(0, min(len(ordered), math.ceil(q / 100 * len(ordered))) - 1)
+        return ordered[rank]
+
+    def summary(self):
+        """Return count, mean and p50/p95/p99 in milliseconds"""
+        ordered = sorted(self.samples)
+        return {
+            'count': self.count,
+            'mean_ms': (self.total / self.count * 1000) if self.count else 0.0,
+            'p50_ms': self.percentile(50, ordered) * 1000,
+            'p95_ms': self.percentile(95, ordered) * 1000,
+            'p99_ms': self.percentile(99, ordered) * 1000,
+        }
+
+
+_histograms = {}
+_histograms_lock = threading.Lock()
+
+
+def record(name, seconds):
+    """Record one duration for a stage"""
+    with _histograms_lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = StageHistogram()
+        histogram.add(seconds)
+    spans = _current_spans.get()
+    if spans is not None:
+        spans.append((name, seconds))
+
+
+@contextmanager
+def span(name):
+    """Time the enclosed block as stage name"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter() - start)
+
+
+def timed(name):
+    """Decorator form of span()"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def timed_iter(name, iterable):
+    """
+    Yield from iterable, recording the time spent producing items as one span.
+
+    Time the consumer spends between items is not counted, so a generator that hands
+    out pages to a caller doing its own work is measured fairly.
+    """
+    iterator = iter(iterable)
+    elapsed = 0.0
+    try:
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                elapsed += time.perf_counter() - start
+                return
+            elapsed += time.perf_counter() - start
+            yield item
+    finally:
+        record(name, elapsed)
+
+
+@contextmanager
+def collect_spans():
+    """Collect the (name, seconds) spans recorded inside the block into a list"""
+    spans = []
+    token = _current_spans.set(spans)
+    try:
+        yield spans
+    finally:
+        _current_spans.reset(token)
+
+
+def spans_to_timings(spans):
+    """Sum collected spans per stage, in milliseconds"""
+    timings = {}
+    for name, seconds in spans:
+        timings[name] = timings.get(name, 0.0) + seconds * 1000
+    return {name: round(ms, 3) for name, ms in timings.items()}
+
+
+def get_stage_stats():
+    """Return {stage: summary} for every stage timed in this process"""
+    with _histograms_lock:
+        return {name: histogram.summary() for name, histogram in sorted(_histograms.items())}
+
+
+def reset_stage_stats():
+    with _histograms_lock:
+        _histograms.clear()
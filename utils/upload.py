@@ -0,0 +1,121 @@
+import hashlib
+import io
+import os
+import tempfile
+from contextlib import contextmanager
+
+
+class _MemoryViewIO(io.RawIOBase):
+    """Read-only, seekable raw stream over a memoryview"""
+
+    def __init__(self, view):
+        super().__init__()
+        self._view = view
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        size = min(len(buffer), len(self._view) - self._pos)
+        if size <= 0:
+            return 0
+        buffer[:size] = self._view[self._pos:self._pos + size]
+        self._pos += size
+        return size
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._pos + offset
+        elif whence == io.SEEK_END:
+            position = len(self._view) + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError("Negative seek position")
+        self._pos = position
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+
+class UploadedDocument:
+    """
+    An uploaded file held in memory exactly once.
+
+    Streamlit uploads are BytesIO objects, so the document keeps a memoryview over
+    their buffer instead of copying it. Parsers get independent file-like views over
+    that buffer via open(), a temp file is only written when an external tool needs a
+    path (as_path), and a bytes copy is only made when the content has to cross a
+    process boundary (tobytes).
+    """
+
+    def __init__(self, buffer, name='', mime_type=''):
+        self.view = memoryview(buffer)
+        self.name = name
+        self.mime_type = mime_type
+        self._bytes = buffer if isinstance(buffer, bytes) else None
+        self._sha256 = None
+
+    @classmethod
+    def from_upload(cls, file):
+        """Wrap a Streamlit upload, file-like object or bytes without copying where possible"""
+        if isinstance(file, cls):
+            return file
+        if isinstance(file, (bytes, bytearray, memoryview)):
+            return cls(file)
+
+        name = getattr(file, 'name', '') or ''
+        mime_type = getattr(file, 'type', '') or ''
+        if hasattr(file, 'getbuffer'):
+            return cls(file.getbuffer(), name=name, mime_type=mime_type)
+        data = file.read()
+        file.seek(0)  # Reset file pointer
+        return cls(data, name=name, mime_type=mime_type)
+
+    def __len__(self):
+        return self.view.nbytes
+
+    @property
+    def sha256(self):
+        """Hex digest of the content, computed once"""
+        if self._sha256 is None:
+            self._sha256 = hashlib.sha256(self.view).hexdigest()
+        return self._sha256
+
+    def open(self):
+        """Return a new read-only file-like view over the content"""
+        return io.BufferedReader(_MemoryViewIO(self.view))
+
+    def tobytes(self):
+        """Return the content as bytes, copying at most once"""
+        if self._bytes is None:
+            self._bytes = self.view.tobytes()
+        return self._bytes
+
+    @contextmanager
+    def as_path(self, suffix=''):
+        """Materialize the content to a temporary file for tools that need a path"""
+        fd, path = tempfile.mkstemp(suffix=suffix)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(self.view)
+            yield path
+        finally:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+
+def open_stream(source):
+    """Return a file-like object for an UploadedDocument or raw bytes"""
+    if isinstance(source, UploadedDocument):
+        return source.open()
+    return io.BytesIO(source)  # BytesIO shares the bytes buffer until it is written